@@ -11,130 +11,167 @@ Author: Generated for thankGodForJesusChrist
 Date: September 2025
 """
 
-import networkx as nx
-import numpy as np
-import matplotlib.pyplot as plt
-
-
-def create_city_map():
-    """
-    Create the city map with logical W1-W5 layout with bidirectional edges and directional labels.
-
-    Returns:
-        NetworkX.DiGraph: Complete city map graph with directional edges
-    """
-    # Define all nodes in the system
-    node_names = [
-        # Buildings (0-11)
-        "Post Office",
-        "Train Station",
-        "Book Shop",
-        "Hospital",
-        "Church",
-        "Police Station",
-        "Sports Centre",
-        "Bank",
-        "Fire Station",
-        "Supermarket",
-        "Bakery",
-        "Clinic",
-        # West Street (12-16): W1 (North) → W2 → W3 → W4 → W5 (South)
-        "W1",
-        "W2",
-        "W3",
-        "W4",
-        "W5",
-        # North Street (17-19): N1 (West) → N2 → N3 (East)
-        "N1",
-        "N2",
-        "N3",
-        # East Street (20-22): E1 (North) → E2 → E3 (South)
-        "E1",
-        "E2",
-        "E3",
-    ]
-
-    # Create directed graph with edge labels
-    G = nx.DiGraph()
-
-    # Add all nodes
-    G.add_nodes_from(node_names)
+import os
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 
-    # Helper function to add bidirectional edges with labels
-    def add_bidirectional_edge(
-        from_node, to_node, from_to_direction, to_from_direction
-    ):
-        G.add_edge(from_node, to_node, direction=from_to_direction)
-        G.add_edge(to_node, from_node, direction=to_from_direction)
+import networkx as nx
 
+# Search helpers shared with the path tool service, whose directory must stay
+# self-contained for its Docker build
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "simplePathToolWithDefaultMap"
+    ),
+)
+from map_search import OPPOSITE, cached, get_turn, shortest_path
+
+
+# Buildings, also drawn in a different colour from street nodes
+_BUILDING_NODES = (
+    "Post Office",
+    "Train Station",
+    "Book Shop",
+    "Hospital",
+    "Church",
+    "Police Station",
+    "Sports Centre",
+    "Bank",
+    "Fire Station",
+    "Supermarket",
+    "Bakery",
+    "Clinic",
+)
+
+_STREET_NODES = (
+    # West Street: W1 (North) → W2 → W3 → W4 → W5 (South)
+    "W1",
+    "W2",
+    "W3",
+    "W4",
+    "W5",
+    # North Street: N1 (West) → N2 → N3 (East)
+    "N1",
+    "N2",
+    "N3",
+    # East Street: E1 (North) → E2 → E3 (South)
+    "E1",
+    "E2",
+    "E3",
+)
+
+# Bidirectional connections with directional labels:
+# (from_node, to_node, from_to_direction); the reverse edge always points
+# the opposite way, so its label is derived from OPPOSITE
+_CONNECTIONS = (
     # Building-to-street connections (bidirectional with appropriate directions)
     # West Street buildings
-    add_bidirectional_edge("Post Office", "W5", "East", "West")
-    add_bidirectional_edge("Train Station", "W5", "West", "East")
-    add_bidirectional_edge("Book Shop", "W4", "West", "East")
-    add_bidirectional_edge("Hospital", "W3", "West", "East")
-    add_bidirectional_edge("Church", "W3", "East", "West")
-    add_bidirectional_edge("Police Station", "W1", "East", "West")
-
+    ("Post Office", "W5", "East"),
+    ("Train Station", "W5", "West"),
+    ("Book Shop", "W4", "West"),
+    ("Hospital", "W3", "West"),
+    ("Church", "W3", "East"),
+    ("Police Station", "W1", "East"),
     # North Street buildings
-    add_bidirectional_edge("Sports Centre", "N1", "South", "North")
-    add_bidirectional_edge("Bank", "N2", "South", "North")
-    add_bidirectional_edge("Fire Station", "N3", "South", "North")
-
+    ("Sports Centre", "N1", "South"),
+    ("Bank", "N2", "South"),
+    ("Fire Station", "N3", "South"),
     # East Street buildings
-    add_bidirectional_edge("Supermarket", "E1", "East", "West")
-    add_bidirectional_edge("Bakery", "E2", "East", "West")
-    add_bidirectional_edge("Clinic", "E3", "East", "West")
-
+    ("Supermarket", "E1", "East"),
+    ("Bakery", "E2", "East"),
+    ("Clinic", "E3", "East"),
     # Street connections with proper directional labels
     # West Street: W1 (North) ↔ W2 ↔ W3 ↔ W4 ↔ W5 (South)
-    add_bidirectional_edge("W1", "W2", "South", "North")
-    add_bidirectional_edge("W2", "W3", "South", "North")
-    add_bidirectional_edge("W3", "W4", "South", "North")
-    add_bidirectional_edge("W4", "W5", "South", "North")
-
+    ("W1", "W2", "South"),
+    ("W2", "W3", "South"),
+    ("W3", "W4", "South"),
+    ("W4", "W5", "South"),
     # North Street: N1 (West) ↔ N2 ↔ N3 (East)
-    add_bidirectional_edge("N1", "N2", "East", "West")
-    add_bidirectional_edge("N2", "N3", "East", "West")
-
+    ("N1", "N2", "East"),
+    ("N2", "N3", "East"),
     # East Street: E1 (North) ↔ E2 ↔ E3 (South)
-    add_bidirectional_edge("E1", "E2", "South", "North")
-    add_bidirectional_edge("E2", "E3", "South", "North")
-
+    ("E1", "E2", "South"),
+    ("E2", "E3", "South"),
     # Inter-street connections
-    add_bidirectional_edge("W2", "N1", "East", "West")
-    add_bidirectional_edge("N2", "E1", "South", "North")
-
+    ("W2", "N1", "East"),
+    ("N2", "E1", "South"),
     # Building-to-building adjacencies (same location or adjacent blocks)
     # Same node connections
-    #add_bidirectional_edge("Post Office", "Train Station", "East", "West")
-    #add_bidirectional_edge("Hospital", "Church", "West", "East")
-
+    # ("Post Office", "Train Station", "East"),
+    # ("Hospital", "Church", "West"),
     # West Street building chains
-    #add_bidirectional_edge("Post Office", "Church", "North", "South")
-    #add_bidirectional_edge("Church", "Police Station", "North", "South")
-    #add_bidirectional_edge("Train Station", "Book Shop", "North", "South")
-    #add_bidirectional_edge("Book Shop", "Hospital", "North", "South")
-
+    # ("Post Office", "Church", "North"),
+    # ("Church", "Police Station", "North"),
+    # ("Train Station", "Book Shop", "North"),
+    # ("Book Shop", "Hospital", "North"),
     # North Street building chain
-    #add_bidirectional_edge("Sports Centre", "Bank", "East", "West")
-    #add_bidirectional_edge("Bank", "Fire Station", "East", "West")
-
+    # ("Sports Centre", "Bank", "East"),
+    # ("Bank", "Fire Station", "East"),
     # East Street building chain
-    #add_bidirectional_edge("Supermarket", "Bakery", "South", "North")
-    #add_bidirectional_edge("Bakery", "Clinic", "South", "North")
+    # ("Supermarket", "Bakery", "South"),
+    # ("Bakery", "Clinic", "South"),
+)
 
-    return G
+# Intern node names once so the graph, the lookup tables built from it and
+# interned query strings all share the same objects (identity dict hits).
+_BUILDING_NODES = tuple(map(sys.intern, _BUILDING_NODES))
+_STREET_NODES = tuple(map(sys.intern, _STREET_NODES))
+_CONNECTIONS = tuple(
+    (sys.intern(from_node), sys.intern(to_node), direction)
+    for from_node, to_node, direction in _CONNECTIONS
+)
 
+# Set view of the buildings for O(1) membership tests
+_BUILDING_SET = frozenset(_BUILDING_NODES)
 
-def get_node_positions():
+
+def create_city_map():
     """
-    Define fixed positions for map visualization.
+    Create the city map with logical W1-W5 layout with bidirectional edges and directional labels.
+
+    Returns:
+        NetworkX.DiGraph: Complete city map graph with directional edges,
+        frozen against node/edge changes
+    """
+    # Define all nodes in the system
+    node_names = [*_BUILDING_NODES, *_STREET_NODES]
+
+    # Create directed graph with edge labels
+    G = nx.DiGraph()
+
+    # Add all nodes, then both directions of every connection in one pass
+    G.add_nodes_from(node_names)
+    G.add_edges_from(
+        edge
+        for from_node, to_node, direction in _CONNECTIONS
+        for edge in (
+            (from_node, to_node, {"direction": direction}),
+            (to_node, from_node, {"direction": OPPOSITE[direction]}),
+        )
+    )
+
+    # Frozen: the map is static, and pathfinding iterates G._adj directly
+    return nx.freeze(G)
+
+
+@lru_cache(maxsize=1)
+def get_default_map():
+    """
+    Get the default city map, built once per process and shared by all callers.
 
     Returns:
-        dict: Node positions in (x, y) coordinates
+        NetworkX.DiGraph: The frozen map from create_city_map()
     """
-    return {
+    return create_city_map()
+
+
+# Fixed (x, y) map coordinates of every node, shared read-only by all renders
+_POSITIONS = MappingProxyType(
+    {
         # West Street buildings
         "Police Station": (2, 12),
         "Church": (2, 8),
@@ -163,59 +200,30 @@ def get_node_positions():
         "E2": (9, 6),
         "E3": (9, 4),
     }
+)
 
 
-def render_map(G, positions):
+def get_node_positions():
     """
-    Render the city map visualization with directional edge labels.
-
-    Args:
-        G (NetworkX.DiGraph): City map directed graph
-        positions (dict): Node position coordinates
+    Define fixed positions for map visualization.
 
     Returns:
-        dict: Position dictionary for further use
+        Mapping: Read-only node positions in (x, y) coordinates
     """
-    plt.figure(figsize=(20, 14))
+    return _POSITIONS
 
-    # Color coding
-    building_nodes = [
-        "Post Office",
-        "Train Station",
-        "Book Shop",
-        "Hospital",
-        "Church",
-        "Police Station",
-        "Sports Centre",
-        "Bank",
-        "Fire Station",
-        "Supermarket",
-        "Bakery",
-        "Clinic",
-    ]
-
-    node_colors = [
-        "lightcoral" if node in building_nodes else "lightblue" for node in G.nodes()
-    ]
 
-    # Draw graph nodes
-    nx.draw_networkx_nodes(
-        G, positions, node_color=node_colors, node_size=2000, alpha=0.9
-    )
-    nx.draw_networkx_labels(G, positions, font_size=8, font_weight="bold")
+def _node_colors(G):
+    """Fill colour for every node, in G.nodes() order."""
+    return ["lightcoral" if node in _BUILDING_SET else "lightblue" for node in G]
 
-    # Draw edges (convert to undirected for cleaner visualization)
-    undirected_G = G.to_undirected()
-    nx.draw_networkx_edges(
-        undirected_G, positions, edge_color="gray", width=2, alpha=0.7
-    )
 
-    # Draw edge labels with directions
+def _build_edge_labels(G):
+    """Two-line "forward\\nreverse" direction label per bidirectional edge."""
     edge_labels = {}
     processed_edges = set()
 
-    for edge in G.edges(data=True):
-        from_node, to_node, data = edge
+    for from_node, to_node, data in G.edges(data=True):
         # Avoid duplicate labels for bidirectional edges
         if (to_node, from_node) not in processed_edges:
             direction1 = data.get("direction", "")
@@ -227,13 +235,93 @@ def render_map(G, positions):
                 edge_labels[(from_node, to_node)] = f"{direction1}\n{direction2}"
             processed_edges.add((from_node, to_node))
 
+    return edge_labels
+
+
+def _edge_labels(G):
+    """Edge labels for G; the frozen map's labels are built only once."""
+    return cached(G, "edge_labels", _build_edge_labels)
+
+
+def _edge_segments(G, positions):
+    """One ((x1, y1), (x2, y2)) line segment per connection, ignoring direction."""
+    return [
+        (positions[from_node], positions[to_node])
+        for from_node, to_node in G.edges()
+        if not (to_node < from_node and G.has_edge(to_node, from_node))
+    ]
+
+
+def render_map(G, positions, dpi=100, save_path="city_map_bidirectional.png"):
+    """
+    Render the city map visualization with directional edge labels and save
+    it to save_path.
+
+    Args:
+        G (NetworkX.DiGraph): City map directed graph
+        positions (dict): Node position coordinates
+        dpi (int): Output resolution; 100 is enough for previews, use 300
+            only for publication-quality images (render cost grows with dpi²)
+        save_path (str): Image file to write
+
+    Returns:
+        dict: Position dictionary for further use
+    """
+    # Imported here so pathfinding-only callers never pay for matplotlib.
+    # A bare Figure bypasses pyplot's global figure registry, so repeated
+    # renders in a long-running process do not pile up open figures.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(20, 14))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    # Color coding
+    node_colors = _node_colors(G)
+
+    # Draw graph nodes as a single scatter collection
+    xy = [positions[node] for node in G]
+    ax.scatter(
+        [x for x, _ in xy],
+        [y for _, y in xy],
+        s=2000,
+        c=node_colors,
+        alpha=0.9,
+        zorder=2,
+    )
+    nx.draw_networkx_labels(G, positions, font_size=8, font_weight="bold", ax=ax)
+
+    # Draw every street/building connection once, as a single line collection
+    segments = _edge_segments(G, positions)
+    ax.add_collection(
+        LineCollection(
+            segments,
+            colors="gray",
+            linewidths=2,
+            alpha=0.7,
+            zorder=1,
+            rasterized=True,
+        )
+    )
+    xs = [x for segment in segments for x, _ in segment]
+    ys = [y for segment in segments for _, y in segment]
+    pad_x = 0.05 * (max(xs) - min(xs))
+    pad_y = 0.05 * (max(ys) - min(ys))
+    ax.update_datalim(
+        [(min(xs) - pad_x, min(ys) - pad_y), (max(xs) + pad_x, max(ys) + pad_y)]
+    )
+    ax.autoscale_view()
+
     # Draw edge labels
     nx.draw_networkx_edge_labels(
-        undirected_G,
+        G,
         positions,
-        edge_labels,
+        _edge_labels(G),
         font_size=6,
         bbox=dict(boxstyle="round,pad=0.1", facecolor="white", alpha=0.7),
+        ax=ax,
     )
 
     # Add street labels
@@ -243,7 +331,7 @@ def render_map(G, positions):
         (11, 6, "EAST\nSTREET"),
     ]
     for x, y, label in street_labels:
-        plt.text(
+        ax.text(
             x,
             y,
             label,
@@ -253,31 +341,49 @@ def render_map(G, positions):
             bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7),
         )
 
-    plt.title(
+    ax.set_title(
         "City Map - W1-W5 Bidirectional Layout with Directional Labels\nPolice Station-W1, Church-W3-Hospital, W4-BookShop, PostOffice-W5-TrainStation",
         fontsize=14,
         fontweight="bold",
         pad=20,
     )
-    plt.axis("off")
-    plt.tight_layout()
-    plt.savefig("city_map_bidirectional.png", dpi=300, bbox_inches="tight")
-    plt.show()
+    ax.axis("off")
+    fig.tight_layout()
+    fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
 
     return positions
 
 
 def find_path(G, start, end):
     """
-    Find shortest path between two locations preserving edge direction information.
-    Uses Dijkstra's algorithm to maintain access to edge attributes.
+    Find shortest path between two locations on the directed graph.
+    Edges are unweighted, so one breadth-first search per source gives every
+    shortest path; for the frozen map those predecessors are precomputed for
+    all sources, and a query just walks back from end in O(path length).
+    Edge direction labels stay available on the directed graph for
+    navigation.
+
+    Returns:
+        list: Nodes along the path, or None if there is no path or start or
+        end is not on the map
     """
-    try:
-        # Use Dijkstra's on the directed graph to preserve edge data
-        # This allows us to access directional labels during navigation
-        return nx.dijkstra_path(G, start, end)
-    except nx.NetworkXNoPath:
-        return None
+    return shortest_path(G, sys.intern(start), sys.intern(end))
+
+
+# Compact (from, to, direction) record for one step of a path. It hashes and
+# compares like a plain tuple, so it doubles as a _STEP_INSTRUCTIONS key.
+_PathEdge = namedtuple("_PathEdge", "from_ to direction")
+
+
+def _path_edges(G, path):
+    """_PathEdge for each consecutive pair of nodes along path."""
+    adj = G._adj
+    return [
+        _PathEdge(
+            current, next_node, adj[current][next_node].get("direction", "Unknown")
+        )
+        for current, next_node in zip(path, path[1:])
+    ]
 
 
 def find_path_with_edges(G, start, end):
@@ -287,32 +393,111 @@ def find_path_with_edges(G, start, end):
     Returns:
         tuple: (path_nodes, path_edges) where path_edges contains direction info
     """
-    try:
-        # Get the path
-        path = nx.dijkstra_path(G, start, end)
-
-        # Get edge data for each step
-        path_edges = []
-        for i in range(len(path) - 1):
-            current = path[i]
-            next_node = path[i + 1]
-            edge_data = G.get_edge_data(current, next_node)
-            path_edges.append(
-                {
-                    "from": current,
-                    "to": next_node,
-                    "direction": (
-                        edge_data.get("direction", "Unknown")
-                        if edge_data
-                        else "Unknown"
-                    ),
-                }
-            )
-
-        return path, path_edges
-    except nx.NetworkXNoPath:
+    # Get the path (one traversal; None when unreachable or unknown)
+    path = find_path(G, start, end)
+    if path is None:
         return None, None
 
+    # Callers get one plain dict per step ("from", "to", "direction")
+    path_edges = [
+        {"from": edge.from_, "to": edge.to, "direction": edge.direction}
+        for edge in _path_edges(G, path)
+    ]
+
+    return path, path_edges
+
+
+# Street context keyed on the first letters of the two node names
+_STREET_BY_PREFIX = {
+    ("W", "W"): "West Street",
+    ("N", "N"): "North Street",
+    ("E", "E"): "East Street",
+    ("W", "N"): "to connecting street",
+    ("N", "W"): "to connecting street",
+    ("N", "E"): "to connecting street",
+    ("E", "N"): "to connecting street",
+}
+
+# First letters of street node names
+_STREET_PREFIXES = frozenset("WNE")
+
+
+def _street_name(current, next_node):
+    """Determine the street context for a move between two nodes."""
+    return _STREET_BY_PREFIX.get((current[:1], next_node[:1]), "street")
+
+
+# Move templates with the compass heading already upper-cased, filled with
+# (from, to, street); the fallback template takes (from, to)
+_MOVE_TEMPLATES = {
+    direction: f"Go {direction.upper()} from %s to %s on %s"
+    for direction in ("North", "South", "East", "West")
+}
+_FALLBACK_TEMPLATE = "Move from %s to %s"
+
+
+def _describe_step(current, next_node, direction):
+    """Build the instruction text for a single move along an edge."""
+    if direction == "Unknown":
+        # Fallback for building connections or missing edge data
+        return _FALLBACK_TEMPLATE % (current, next_node)
+    street = _street_name(current, next_node)
+    template = _MOVE_TEMPLATES.get(direction)
+    if template is None:
+        return f"Go {direction.upper()} from {current} to {next_node} on {street}"
+    return template % (current, next_node, street)
+
+
+# Instruction text for every directed edge of the default map, keyed by
+# (from, to, direction) so each navigation step is a single dict lookup.
+_STEP_INSTRUCTIONS = {
+    (from_node, to_node, data["direction"]): _describe_step(
+        from_node, to_node, data["direction"]
+    )
+    for from_node, to_node, data in get_default_map().edges(data=True)
+}
+
+
+# Exit directions from each building
+_EXIT_DIRECTIONS = {
+    "Post Office": "Exit Post Office heading EAST to West Street (W5)",
+    "Train Station": "Exit Train Station heading WEST to West Street (W5)",
+    "Book Shop": "Exit Book Shop heading WEST to West Street (W4)",
+    "Hospital": "Exit Hospital heading WEST to West Street (W3)",
+    "Church": "Exit Church heading EAST to West Street (W3)",
+    "Police Station": "Exit Police Station heading EAST to West Street (W1)",
+    "Sports Centre": "Exit Sports Centre heading SOUTH to North Street (N1)",
+    "Bank": "Exit Bank heading NORTH to North Street (N2)",
+    "Fire Station": "Exit Fire Station heading NORTH to North Street (N3)",
+    "Supermarket": "Exit Supermarket heading EAST to East Street (E1)",
+    "Bakery": "Exit Bakery heading EAST to East Street (E2)",
+    "Clinic": "Exit Clinic heading EAST to East Street (E3)",
+}
+
+# Entrance directions into each building
+_ENTRANCE_DIRECTIONS = {
+    "Post Office": "Enter Post Office from West Street (W5) - entrance faces EAST",
+    "Train Station": "Enter Train Station from West Street (W5) - entrance faces WEST",
+    "Book Shop": "Enter Book Shop from West Street (W4) - entrance faces WEST",
+    "Hospital": "Enter Hospital from West Street (W3) - entrance faces WEST",
+    "Church": "Enter Church from West Street (W3) - entrance faces EAST",
+    "Police Station": "Enter Police Station from West Street (W1) - entrance faces EAST",
+}
+
+# Constant footer appended to every set of navigation instructions
+_LAYOUT_SUMMARY = (
+    "",
+    "✅ BIDIRECTIONAL LAYOUT SUMMARY:",
+    "• Police Station at W1 (northernmost)",
+    "• W2 connects directly to N1 (West/North Streets)",
+    "• N2 connects directly to E1 (North/East Streets)",
+    "• Church (WEST) and Hospital (EAST) at W3",
+    "• Book Shop at W4 (EAST side)",
+    "• Post Office (WEST) and Train Station (EAST) at W5",
+    "• All edges are bidirectional with compass directions",
+    "• W5→W4: North, W4→W5: South (example)",
+)
+
 
 def generate_navigation_instructions(G, start, end, positions):
     """
@@ -327,100 +512,30 @@ def generate_navigation_instructions(G, start, end, positions):
     Returns:
         str: Formatted navigation instructions with directional information
     """
-    path, path_edges = find_path_with_edges(G, start, end)
+    path = find_path(G, start, end)
     if not path:
         return f"No path found from {start} to {end}"
 
+    # Exit step, one step per edge (direction labels along the path), entrance step
+    steps = chain(
+        (_EXIT_DIRECTIONS[start],) if start in _EXIT_DIRECTIONS else (),
+        (
+            _STEP_INSTRUCTIONS.get(edge) or _describe_step(*edge)
+            for edge in _path_edges(G, path)
+        ),
+        (_ENTRANCE_DIRECTIONS[end],) if end in _ENTRANCE_DIRECTIONS else (),
+    )
+
+    # Built as one list display rather than grown append by append
     instructions = [
         f"🗺️ NAVIGATION: {start} → {end}",
         f"📍 Path: {' → '.join(path)}",
         "",
         "📋 STEP-BY-STEP INSTRUCTIONS:",
+        *(f"{number}. {text}" for number, text in enumerate(steps, 1)),
+        *_LAYOUT_SUMMARY,
     ]
 
-    # Exit directions
-    exit_directions = {
-        "Post Office": "Exit Post Office heading EAST to West Street (W5)",
-        "Train Station": "Exit Train Station heading WEST to West Street (W5)",
-        "Book Shop": "Exit Book Shop heading WEST to West Street (W4)",
-        "Hospital": "Exit Hospital heading WEST to West Street (W3)",
-        "Church": "Exit Church heading EAST to West Street (W3)",
-        "Police Station": "Exit Police Station heading EAST to West Street (W1)",
-        "Sports Centre": "Exit Sports Centre heading SOUTH to North Street (N1)",
-        "Bank": "Exit Bank heading NORTH to North Street (N2)",
-        "Fire Station": "Exit Fire Station heading NORTH to North Street (N3)",
-        "Supermarket": "Exit Supermarket heading EAST to East Street (E1)",
-        "Bakery": "Exit Bakery heading EAST to East Street (E2)",
-        "Clinic": "Exit Clinic heading EAST to East Street (E3)",
-    }
-
-    step = 1
-    if start in exit_directions:
-        instructions.append(f"{step}. {exit_directions[start]}")
-        step += 1
-
-    # Generate path instructions using edge direction labels from path_edges
-    for edge_info in path_edges:
-        current = edge_info["from"]
-        next_node = edge_info["to"]
-        direction = edge_info["direction"]
-
-        # Determine street context
-        if current.startswith("W") and next_node.startswith("W"):
-            street_name = "West Street"
-        elif current.startswith("N") and next_node.startswith("N"):
-            street_name = "North Street"
-        elif current.startswith("E") and next_node.startswith("E"):
-            street_name = "East Street"
-        elif (current.startswith("W") and next_node.startswith("N")) or (
-            current.startswith("N") and next_node.startswith("W")
-        ):
-            street_name = "to connecting street"
-        elif (current.startswith("N") and next_node.startswith("E")) or (
-            current.startswith("E") and next_node.startswith("N")
-        ):
-            street_name = "to connecting street"
-        else:
-            street_name = "street"
-
-        if direction != "Unknown":
-            instructions.append(
-                f"{step}. Go {direction.upper()} from {current} to {next_node} on {street_name}"
-            )
-        else:
-            # Fallback for building connections or missing edge data
-            instructions.append(f"{step}. Move from {current} to {next_node}")
-
-        step += 1
-
-    # Entrance directions
-    entrance_directions = {
-        "Post Office": "Enter Post Office from West Street (W5) - entrance faces EAST",
-        "Train Station": "Enter Train Station from West Street (W5) - entrance faces WEST",
-        "Book Shop": "Enter Book Shop from West Street (W4) - entrance faces WEST",
-        "Hospital": "Enter Hospital from West Street (W3) - entrance faces WEST",
-        "Church": "Enter Church from West Street (W3) - entrance faces EAST",
-        "Police Station": "Enter Police Station from West Street (W1) - entrance faces EAST",
-    }
-
-    if end in entrance_directions:
-        instructions.append(f"{step}. {entrance_directions[end]}")
-
-    instructions.extend(
-        [
-            "",
-            "✅ BIDIRECTIONAL LAYOUT SUMMARY:",
-            "• Police Station at W1 (northernmost)",
-            "• W2 connects directly to N1 (West/North Streets)",
-            "• N2 connects directly to E1 (North/East Streets)",
-            "• Church (WEST) and Hospital (EAST) at W3",
-            "• Book Shop at W4 (EAST side)",
-            "• Post Office (WEST) and Train Station (EAST) at W5",
-            "• All edges are bidirectional with compass directions",
-            "• W5→W4: North, W4→W5: South (example)",
-        ]
-    )
-
     return "\n".join(instructions)
 
 
@@ -435,20 +550,15 @@ def analyze_map(G):
     undirected_G = G.to_undirected()
     print(f"Graph is connected: {nx.is_connected(undirected_G)}")
 
-    # Categorize nodes
-    buildings = [
-        node
-        for node in G.nodes()
-        if isinstance(node, str)
-        and not any(node.startswith(prefix) for prefix in ["W", "N", "E"])
-        and node != "Junction"
-    ]
-    streets = [
-        node
-        for node in G.nodes()
-        if isinstance(node, str)
-        and any(node.startswith(prefix) for prefix in ["W", "N", "E"])
-    ]
+    # Categorize nodes in a single pass, dispatching on the first character
+    buildings, streets = [], []
+    for node in G.nodes():
+        if not isinstance(node, str):
+            continue
+        if node[:1] in _STREET_PREFIXES:
+            streets.append(node)
+        elif node != "Junction":
+            buildings.append(node)
 
     print(f"Buildings: {len(buildings)}")
     print(f"Street nodes: {len(streets)}")
@@ -466,15 +576,16 @@ def main():
     """Main execution function."""
     print("🗺️ Creating City Map Navigation System...")
 
-    # Create map
-    city_map = create_city_map()
+    # Default map, shared with every other caller in this process
+    city_map = get_default_map()
     positions = get_node_positions()
 
     # Analyze map
     analyze_map(city_map)
 
     # Render visualization
-    render_map(city_map, positions)
+    render_map(city_map, positions, dpi=300)
+    print("🖼️ Map saved to city_map_bidirectional.png")
 
     # Sample navigation examples
     print("\n🧭 SAMPLE NAVIGATION:")
@@ -19,7 +19,7 @@ buildings = [
     "Clinic",  # E3 - West side
 ]
 
-from city_map import create_city_map, find_path_with_edges
+from city_map import find_path_with_edges, get_default_map, get_turn
 
 
 def get_path_and_edges(start, end):
@@ -36,7 +36,7 @@ def get_path_and_edges(start, end):
             {'from': 'W1', 'to': 'W2', 'direction': 'South', 'turn': 'right'}
         ]
     """
-    G = create_city_map()
+    G = get_default_map()
     path, edges = find_path_with_edges(G, start, end)
 
     if not path or not edges:
@@ -132,26 +132,7 @@ class FacingState:
         Returns:
             str: Turn instruction ('left', 'right', 'around', 'straight')
         """
-        if self.current_direction == target_direction:
-            return "straight"
-
-        # Define turn relationships (current -> target: turn_needed)
-        turn_map = {
-            (self.NORTH, self.EAST): "right",
-            (self.NORTH, self.SOUTH): "around",
-            (self.NORTH, self.WEST): "left",
-            (self.EAST, self.SOUTH): "right",
-            (self.EAST, self.WEST): "around",
-            (self.EAST, self.NORTH): "left",
-            (self.SOUTH, self.WEST): "right",
-            (self.SOUTH, self.NORTH): "around",
-            (self.SOUTH, self.EAST): "left",
-            (self.WEST, self.NORTH): "right",
-            (self.WEST, self.EAST): "around",
-            (self.WEST, self.SOUTH): "left",
-        }
-
-        return turn_map.get((self.current_direction, target_direction), "unknown")
+        return get_turn(self.current_direction, target_direction)
 
     def __str__(self):
         """String representation of FacingState."""
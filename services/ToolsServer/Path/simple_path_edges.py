@@ -4,7 +4,7 @@ Simple Path with Edges Function
 Just the essentials: input start/end locations, output path with all nodes and edges.
 """
 
-from city_map import create_city_map, find_path_with_edges
+from city_map import find_path_with_edges, get_default_map
 
 
 def get_path_with_edges(start, end):
@@ -18,8 +18,7 @@ def get_path_with_edges(start, end):
     Returns:
         tuple: (path_nodes, path_edges) or (None, None) if no path
     """
-    # Create city map
-    G = create_city_map()
+    G = get_default_map()
 
     # Find path with edges
     path, edges = find_path_with_edges(G, start, end)
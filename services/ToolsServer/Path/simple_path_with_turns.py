@@ -4,7 +4,7 @@ Super Simple Path with Turn Instructions
 Just the basic function you need with turn instructions included.
 """
 
-from city_map import create_city_map, find_path_with_edges
+from city_map import find_path_with_edges, get_default_map, get_turn
 
 
 class FacingState:
@@ -14,26 +14,9 @@ class FacingState:
         self.current = None
 
     def turn_to(self, target):
-        if self.current == target:
-            return "straight"
         if self.current is None:
             return "start"
-
-        turns = {
-            ("North", "East"): "right",
-            ("North", "South"): "around",
-            ("North", "West"): "left",
-            ("East", "South"): "right",
-            ("East", "West"): "around",
-            ("East", "North"): "left",
-            ("South", "West"): "right",
-            ("South", "North"): "around",
-            ("South", "East"): "left",
-            ("West", "North"): "right",
-            ("West", "East"): "around",
-            ("West", "South"): "left",
-        }
-        return turns.get((self.current, target), "unknown")
+        return get_turn(self.current, target)
 
 
 def get_path_with_turns(start, end):
@@ -44,7 +27,7 @@ def get_path_with_turns(start, end):
         path: list of nodes
         edges: list with 'from', 'to', 'direction', 'turn'
     """
-    G = create_city_map()
+    G = get_default_map()
     path, edges = find_path_with_edges(G, start, end)
 
     if not edges:
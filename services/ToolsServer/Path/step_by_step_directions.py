@@ -15,11 +15,15 @@ Author: Generated for thankGodForJesusChrist
 Date: September 2025
 """
 
-from typing import List, Dict, Tuple, Optional, Union
+import sys
+from typing import List, Dict, Tuple, Union
+from collections import Counter
 from dataclasses import dataclass
+from itertools import chain, groupby
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NavigationStep:
     """Represents a single step in navigation instructions"""
 
@@ -32,109 +36,170 @@ class NavigationStep:
     details: str = ""
 
 
+# Exit direction, street and description for every building
+_EXIT_DIRECTIONS = {
+    "Post Office": {
+        "direction": "EAST",
+        "street": "West Street (W5)",
+        "description": "Exit Post Office heading EAST to West Street (W5)",
+    },
+    "Train Station": {
+        "direction": "WEST",
+        "street": "West Street (W5)",
+        "description": "Exit Train Station heading WEST to West Street (W5)",
+    },
+    "Book Shop": {
+        "direction": "WEST",
+        "street": "West Street (W4)",
+        "description": "Exit Book Shop heading WEST to West Street (W4)",
+    },
+    "Hospital": {
+        "direction": "WEST",
+        "street": "West Street (W3)",
+        "description": "Exit Hospital heading WEST to West Street (W3)",
+    },
+    "Church": {
+        "direction": "EAST",
+        "street": "West Street (W3)",
+        "description": "Exit Church heading EAST to West Street (W3)",
+    },
+    "Police Station": {
+        "direction": "EAST",
+        "street": "West Street (W1)",
+        "description": "Exit Police Station heading EAST to West Street (W1)",
+    },
+    "Sports Centre": {
+        "direction": "SOUTH",
+        "street": "North Street (N1)",
+        "description": "Exit Sports Centre heading SOUTH to North Street (N1)",
+    },
+    "Bank": {
+        "direction": "NORTH",
+        "street": "North Street (N2)",
+        "description": "Exit Bank heading NORTH to North Street (N2)",
+    },
+    "Fire Station": {
+        "direction": "NORTH",
+        "street": "North Street (N3)",
+        "description": "Exit Fire Station heading NORTH to North Street (N3)",
+    },
+    "Supermarket": {
+        "direction": "EAST",
+        "street": "East Street (E1)",
+        "description": "Exit Supermarket heading EAST to East Street (E1)",
+    },
+    "Bakery": {
+        "direction": "EAST",
+        "street": "East Street (E2)",
+        "description": "Exit Bakery heading EAST to East Street (E2)",
+    },
+    "Clinic": {
+        "direction": "EAST",
+        "street": "East Street (E3)",
+        "description": "Exit Clinic heading EAST to East Street (E3)",
+    },
+}
+
+# Entrance direction, street and description for buildings with a known entrance
+_ENTRANCE_DIRECTIONS = {
+    "Post Office": {
+        "direction": "EAST",
+        "street": "West Street (W5)",
+        "description": "Enter Post Office from West Street (W5) - entrance faces EAST",
+    },
+    "Train Station": {
+        "direction": "WEST",
+        "street": "West Street (W5)",
+        "description": "Enter Train Station from West Street (W5) - entrance faces WEST",
+    },
+    "Book Shop": {
+        "direction": "WEST",
+        "street": "West Street (W4)",
+        "description": "Enter Book Shop from West Street (W4) - entrance faces WEST",
+    },
+    "Hospital": {
+        "direction": "WEST",
+        "street": "West Street (W3)",
+        "description": "Enter Hospital from West Street (W3) - entrance faces WEST",
+    },
+    "Church": {
+        "direction": "EAST",
+        "street": "West Street (W3)",
+        "description": "Enter Church from West Street (W3) - entrance faces EAST",
+    },
+    "Police Station": {
+        "direction": "EAST",
+        "street": "West Street (W1)",
+        "description": "Enter Police Station from West Street (W1) - entrance faces EAST",
+    },
+}
+
+# Read-only views of the building tables: every instance shares them, so
+# they must not be changed in place (assign new tables to override them)
+_EXIT_DIRECTIONS = MappingProxyType(
+    {building: MappingProxyType(info) for building, info in _EXIT_DIRECTIONS.items()}
+)
+_ENTRANCE_DIRECTIONS = MappingProxyType(
+    {
+        building: MappingProxyType(info)
+        for building, info in _ENTRANCE_DIRECTIONS.items()
+    }
+)
+
+
+# Street context keyed on the first letters of the two node names
+_STREET_CONTEXTS = {
+    ("W", "W"): "West Street",
+    ("N", "N"): "North Street",
+    ("E", "E"): "East Street",
+    ("W", "N"): "to connecting intersection",
+    ("N", "W"): "to connecting intersection",
+    ("N", "E"): "to connecting intersection",
+    ("E", "N"): "to connecting intersection",
+}
+
+
+def _move_fields(
+    current: str, next_node: str, direction: str, street_context: str
+) -> Tuple[str, str, str, str, str]:
+    """
+    NavigationStep fields after instruction_type for one move along an edge:
+    (direction, from_location, to_location, street_context, details).
+    """
+    if direction != "Unknown":
+        # Interned so every step on the same heading shares one string object
+        heading = sys.intern(direction.upper())
+        return (
+            heading,
+            current,
+            next_node,
+            street_context,
+            f"Go {heading} from {current} to {next_node} on {street_context}",
+        )
+    # Fallback for missing direction data
+    return (
+        "Unknown",
+        current,
+        next_node,
+        street_context,
+        f"Move from {current} to {next_node}",
+    )
+
+
 class StepByStepDirections:
     """
     Handles generation of detailed step-by-step navigation instructions
     for the city map navigation system.
     """
 
-    def __init__(self):
-        """Initialize the direction handler with building and street data"""
-        self.exit_directions = {
-            "Post Office": {
-                "direction": "EAST",
-                "street": "West Street (W5)",
-                "description": "Exit Post Office heading EAST to West Street (W5)",
-            },
-            "Train Station": {
-                "direction": "WEST",
-                "street": "West Street (W5)",
-                "description": "Exit Train Station heading WEST to West Street (W5)",
-            },
-            "Book Shop": {
-                "direction": "WEST",
-                "street": "West Street (W4)",
-                "description": "Exit Book Shop heading WEST to West Street (W4)",
-            },
-            "Hospital": {
-                "direction": "WEST",
-                "street": "West Street (W3)",
-                "description": "Exit Hospital heading WEST to West Street (W3)",
-            },
-            "Church": {
-                "direction": "EAST",
-                "street": "West Street (W3)",
-                "description": "Exit Church heading EAST to West Street (W3)",
-            },
-            "Police Station": {
-                "direction": "EAST",
-                "street": "West Street (W1)",
-                "description": "Exit Police Station heading EAST to West Street (W1)",
-            },
-            "Sports Centre": {
-                "direction": "SOUTH",
-                "street": "North Street (N1)",
-                "description": "Exit Sports Centre heading SOUTH to North Street (N1)",
-            },
-            "Bank": {
-                "direction": "NORTH",
-                "street": "North Street (N2)",
-                "description": "Exit Bank heading NORTH to North Street (N2)",
-            },
-            "Fire Station": {
-                "direction": "NORTH",
-                "street": "North Street (N3)",
-                "description": "Exit Fire Station heading NORTH to North Street (N3)",
-            },
-            "Supermarket": {
-                "direction": "EAST",
-                "street": "East Street (E1)",
-                "description": "Exit Supermarket heading EAST to East Street (E1)",
-            },
-            "Bakery": {
-                "direction": "EAST",
-                "street": "East Street (E2)",
-                "description": "Exit Bakery heading EAST to East Street (E2)",
-            },
-            "Clinic": {
-                "direction": "EAST",
-                "street": "East Street (E3)",
-                "description": "Exit Clinic heading EAST to East Street (E3)",
-            },
-        }
+    # Building exit/entrance data, shared read-only by every instance;
+    # assign new tables on an instance or subclass to override them
+    exit_directions = _EXIT_DIRECTIONS
+    entrance_directions = _ENTRANCE_DIRECTIONS
 
-        self.entrance_directions = {
-            "Post Office": {
-                "direction": "EAST",
-                "street": "West Street (W5)",
-                "description": "Enter Post Office from West Street (W5) - entrance faces EAST",
-            },
-            "Train Station": {
-                "direction": "WEST",
-                "street": "West Street (W5)",
-                "description": "Enter Train Station from West Street (W5) - entrance faces WEST",
-            },
-            "Book Shop": {
-                "direction": "WEST",
-                "street": "West Street (W4)",
-                "description": "Enter Book Shop from West Street (W4) - entrance faces WEST",
-            },
-            "Hospital": {
-                "direction": "WEST",
-                "street": "West Street (W3)",
-                "description": "Enter Hospital from West Street (W3) - entrance faces WEST",
-            },
-            "Church": {
-                "direction": "EAST",
-                "street": "West Street (W3)",
-                "description": "Enter Church from West Street (W3) - entrance faces EAST",
-            },
-            "Police Station": {
-                "direction": "EAST",
-                "street": "West Street (W1)",
-                "description": "Enter Police Station from West Street (W1) - entrance faces EAST",
-            },
-        }
+    def __init__(self):
+        # Move step fields per (from, to, direction) edge, filled on first use
+        self._move_steps = {}
 
     def get_street_context(self, current_node: str, next_node: str) -> str:
         """
@@ -147,22 +212,7 @@ class StepByStepDirections:
         Returns:
             str: Street name or context description
         """
-        if current_node.startswith("W") and next_node.startswith("W"):
-            return "West Street"
-        elif current_node.startswith("N") and next_node.startswith("N"):
-            return "North Street"
-        elif current_node.startswith("E") and next_node.startswith("E"):
-            return "East Street"
-        elif (current_node.startswith("W") and next_node.startswith("N")) or (
-            current_node.startswith("N") and next_node.startswith("W")
-        ):
-            return "to connecting intersection"
-        elif (current_node.startswith("N") and next_node.startswith("E")) or (
-            current_node.startswith("E") and next_node.startswith("N")
-        ):
-            return "to connecting intersection"
-        else:
-            return "street"
+        return _STREET_CONTEXTS.get((current_node[:1], next_node[:1]), "street")
 
     def generate_step_by_step_directions(
         self, path: List[str], path_edges: List[Dict[str, str]]
@@ -186,75 +236,73 @@ class StepByStepDirections:
         end_location = path[-1]
 
         # Add exit instruction if starting from a building
-        if start_location in self.exit_directions:
-            exit_info = self.exit_directions[start_location]
+        exit_info = self.exit_directions.get(start_location)
+        if exit_info is not None:
             steps.append(
                 NavigationStep(
-                    step_number=step_number,
-                    instruction_type="exit",
-                    direction=exit_info["direction"],
-                    from_location=start_location,
-                    to_location=exit_info["street"],
-                    street_context="building_exit",
-                    details=exit_info["description"],
+                    step_number,
+                    "exit",
+                    exit_info["direction"],
+                    start_location,
+                    exit_info["street"],
+                    "building_exit",
+                    exit_info["description"],
                 )
             )
             step_number += 1
 
-        # Add movement instructions for each edge
-        for edge_info in path_edges:
-            current = edge_info["from"]
-            next_node = edge_info["to"]
-            direction = edge_info["direction"]
-            street_context = self.get_street_context(current, next_node)
-
-            if direction != "Unknown":
-                instruction = f"Go {direction.upper()} from {current} to {next_node} on {street_context}"
-                steps.append(
-                    NavigationStep(
-                        step_number=step_number,
-                        instruction_type="move",
-                        direction=direction.upper(),
-                        from_location=current,
-                        to_location=next_node,
-                        street_context=street_context,
-                        details=instruction,
-                    )
-                )
-            else:
-                # Fallback for missing direction data
-                instruction = f"Move from {current} to {next_node}"
-                steps.append(
-                    NavigationStep(
-                        step_number=step_number,
-                        instruction_type="move",
-                        direction="Unknown",
-                        from_location=current,
-                        to_location=next_node,
-                        street_context=street_context,
-                        details=instruction,
-                    )
+        # Add movement instructions for each edge, built in one comprehension
+        # with the step class and edge lookup bound to locals
+        new_step = NavigationStep
+        move_step = self._move_step
+        steps.extend(
+            [
+                new_step(
+                    number,
+                    "move",
+                    *move_step(edge["from"], edge["to"], edge["direction"]),
                 )
-
-            step_number += 1
+                for number, edge in enumerate(path_edges, step_number)
+            ]
+        )
+        step_number += len(path_edges)
 
         # Add entrance instruction if ending at a building
-        if end_location in self.entrance_directions:
-            entrance_info = self.entrance_directions[end_location]
+        entrance_info = self.entrance_directions.get(end_location)
+        if entrance_info is not None:
             steps.append(
                 NavigationStep(
-                    step_number=step_number,
-                    instruction_type="enter",
-                    direction=entrance_info["direction"],
-                    from_location=entrance_info["street"],
-                    to_location=end_location,
-                    street_context="building_entrance",
-                    details=entrance_info["description"],
+                    step_number,
+                    "enter",
+                    entrance_info["direction"],
+                    entrance_info["street"],
+                    end_location,
+                    "building_entrance",
+                    entrance_info["description"],
                 )
             )
 
         return steps
 
+    def _move_step(
+        self, current: str, next_node: str, direction: str
+    ) -> Tuple[str, str, str, str, str]:
+        """
+        _move_fields for one edge, with the street context from
+        get_street_context. Each edge is described once per instance and
+        later routes reuse the stored fields.
+        """
+        key = (current, next_node, direction)
+        fields = self._move_steps.get(key)
+        if fields is None:
+            fields = self._move_steps[key] = _move_fields(
+                current,
+                next_node,
+                direction,
+                self.get_street_context(current, next_node),
+            )
+        return fields
+
     def format_instructions_as_list(self, steps: List[NavigationStep]) -> List[str]:
         """
         Format navigation steps as a simple list of instruction strings.
@@ -285,32 +333,29 @@ class StepByStepDirections:
         if not steps:
             return f"No navigation instructions available from {start} to {end}"
 
-        instructions = [
-            f"🗺️ NAVIGATION: {start} → {end}",
-            f"📍 Path: {' → '.join(path)}",
-            f"📏 Total Steps: {len(steps)}",
-            "",
-            "📋 STEP-BY-STEP INSTRUCTIONS:",
-        ]
-
-        # Add each step
-        for step in steps:
-            instructions.append(f"{step.step_number}. {step.details}")
-
-        # Add navigation summary
-        instructions.extend(
-            [
-                "",
-                "✅ NAVIGATION SUMMARY:",
-                f"• Route: {start} → {end}",
-                f"• Total navigation steps: {len(steps)}",
-                f"• Path length: {len(path)} nodes",
-                "• All directions use compass headings (NORTH/SOUTH/EAST/WEST)",
-            ]
+        # Header, the numbered step lines from format_instructions_as_list,
+        # then the summary, joined in a single pass
+        return "\n".join(
+            chain(
+                (
+                    f"🗺️ NAVIGATION: {start} → {end}",
+                    f"📍 Path: {' → '.join(path)}",
+                    f"📏 Total Steps: {len(steps)}",
+                    "",
+                    "📋 STEP-BY-STEP INSTRUCTIONS:",
+                ),
+                self.format_instructions_as_list(steps),
+                (
+                    "",
+                    "✅ NAVIGATION SUMMARY:",
+                    f"• Route: {start} → {end}",
+                    f"• Total navigation steps: {len(steps)}",
+                    f"• Path length: {len(path)} nodes",
+                    "• All directions use compass headings (NORTH/SOUTH/EAST/WEST)",
+                ),
+            )
         )
 
-        return "\n".join(instructions)
-
     def get_detailed_step_info(self, steps: List[NavigationStep]) -> Dict[str, any]:
         """
         Get detailed analysis of navigation steps.
@@ -324,35 +369,27 @@ class StepByStepDirections:
         if not steps:
             return {}
 
-        # Count step types
-        step_types = {}
+        # Aggregate everything in a single pass over the steps
+        step_types = Counter()
         directions_used = set()
         streets_used = set()
+        directions_sequence = []
 
         for step in steps:
-            step_types[step.instruction_type] = (
-                step_types.get(step.instruction_type, 0) + 1
-            )
+            step_types[step.instruction_type] += 1
             if step.direction != "Unknown":
                 directions_used.add(step.direction)
-            if step.street_context not in ["building_exit", "building_entrance"]:
+                if step.instruction_type == "move":
+                    directions_sequence.append(step.direction)
+            if step.street_context not in ("building_exit", "building_entrance"):
                 streets_used.add(step.street_context)
 
-        # Calculate direction changes
-        directions_sequence = [
-            step.direction
-            for step in steps
-            if step.instruction_type == "move" and step.direction != "Unknown"
-        ]
-        direction_changes = sum(
-            1
-            for i in range(1, len(directions_sequence))
-            if directions_sequence[i] != directions_sequence[i - 1]
-        )
+        # Calculate direction changes: one fewer than the runs of equal headings
+        direction_changes = max(0, sum(1 for _ in groupby(directions_sequence)) - 1)
 
         return {
             "total_steps": len(steps),
-            "step_types": step_types,
+            "step_types": dict(step_types),
             "directions_used": list(directions_used),
             "streets_used": list(streets_used),
             "direction_changes": direction_changes,
@@ -394,18 +431,28 @@ class StepByStepDirections:
         steps = self.generate_step_by_step_directions(path, path_edges)
 
         # Return based on requested format
-        if format_type == "string":
-            return self.format_instructions_as_string(start, end, path, steps)
-        elif format_type == "list":
-            return self.format_instructions_as_list(steps)
-        elif format_type == "steps":
-            return steps
-        elif format_type == "analysis":
-            return self.get_detailed_step_info(steps)
-        else:
+        try:
+            formatter = _FORMATTERS[format_type]
+        except KeyError:
             raise ValueError(
                 f"Invalid format_type: {format_type}. Use 'string', 'list', 'steps', or 'analysis'"
-            )
+            ) from None
+        return formatter(self, start, end, path, steps)
+
+
+# Output builders for generate_navigation_from_path_edges, keyed on format_type
+_FORMATTERS = {
+    "string": lambda self, start, end, path, steps: (
+        self.format_instructions_as_string(start, end, path, steps)
+    ),
+    "list": lambda self, start, end, path, steps: (
+        self.format_instructions_as_list(steps)
+    ),
+    "steps": lambda self, start, end, path, steps: steps,
+    "analysis": lambda self, start, end, path, steps: (
+        self.get_detailed_step_info(steps)
+    ),
+}
 
 
 def create_step_by_step_directions() -> StepByStepDirections:
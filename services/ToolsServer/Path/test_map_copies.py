@@ -0,0 +1,54 @@
+"""Edited copies of the city map must not reuse the frozen map's cached tables"""
+
+import networkx as nx
+
+from city_map import (
+    _edge_labels,
+    create_city_map,
+    find_path,
+    find_path_with_edges,
+    generate_navigation_instructions,
+    get_node_positions,
+)
+
+
+def edited_copy(city_map):
+    """Editable copy of the map without the W2-N1 connection"""
+    copy = nx.DiGraph(city_map)
+    copy.remove_edge("W2", "N1")
+    copy.remove_edge("N1", "W2")
+    return copy
+
+
+def test_paths_on_edited_copy():
+    """Paths on an edited copy avoid the removed connection"""
+    city_map = create_city_map()
+    assert find_path(city_map, "Police Station", "Bakery")[2:4] == ["W2", "N1"]
+
+    for copy in (edited_copy(city_map), edited_copy(city_map.copy())):
+        # W2-N1 was the only link between West Street and the rest
+        assert find_path(copy, "Police Station", "Bakery") is None
+        assert find_path_with_edges(copy, "Police Station", "Bakery") == (None, None)
+        assert generate_navigation_instructions(
+            copy, "Police Station", "Bakery", get_node_positions()
+        ) == "No path found from Police Station to Bakery"
+        assert find_path(copy, "W1", "W3") == ["W1", "W2", "W3"]
+
+    # The original map still routes through W2-N1
+    assert find_path(city_map, "Police Station", "Bakery")[2:4] == ["W2", "N1"]
+
+
+def test_edge_labels_of_edited_copy():
+    """Labels of an edited copy reflect its own edges"""
+    city_map = create_city_map()
+    assert ("W2", "N1") in _edge_labels(city_map)
+
+    copy = edited_copy(city_map)
+    copy["W1"]["W2"]["direction"] = "Down"
+    labels = _edge_labels(copy)
+    assert ("W2", "N1") not in labels and ("N1", "W2") not in labels
+    assert labels[("W1", "W2")] == "Down\nNorth"
+
+    # The original map's labels are unaffected
+    assert _edge_labels(city_map)[("W1", "W2")] == "South\nNorth"
+
@@ -5,6 +5,7 @@ Test script to verify the N2-E1 connection works properly
 
 from city_map import (
     create_city_map,
+    find_path,
     generate_navigation_instructions,
     get_node_positions,
 )
@@ -36,12 +37,10 @@ def test_n2_e1_connection():
         instructions = generate_navigation_instructions(city_map, start, end, positions)
         print(instructions)
 
-        # Check if the route actually uses N2 and E1
-        path_line = [
-            line for line in instructions.split("\n") if line.startswith("📍 Path:")
-        ]
-        if path_line:
-            path = path_line[0]
+        # Check if the route actually uses N2 and E1 (on the path nodes
+        # themselves, rather than parsing the rendered instructions)
+        path = find_path(city_map, start, end)
+        if path:
             if "N2" in path and "E1" in path:
                 print("✅ CONFIRMED: Route uses N2-E1 connection!")
             else:
@@ -2,8 +2,8 @@
 Generate a secure API key for the Simple Path Tool API
 """
 
+import base64
 import secrets
-import string
 
 
 def generate_api_key(length=32):
@@ -18,8 +18,9 @@ def generate_hex_key(length=32):
 
 def generate_custom_key(prefix="sk_", length=32):
     """Generate a custom API key with prefix."""
-    key = secrets.token_urlsafe(length)
-    return f"{prefix}{key}"
+    # Same encoding as secrets.token_urlsafe, appended straight to the prefix
+    key = base64.urlsafe_b64encode(secrets.token_bytes(length)).rstrip(b"=")
+    return prefix + key.decode("ascii")
 
 
 if __name__ == "__main__":
@@ -6,23 +6,31 @@ RESTful API server for pathfinding with turn instructions.
 
 from fastapi import FastAPI, HTTPException, Depends, status, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
 import uvicorn
+import hmac
 import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from path_tool import get_path_with_turns, get_available_locations
 
 
 # API Key Configuration
 API_KEY = os.getenv("API_KEY", "your-secret-api-key-change-this")
+# Encoded once for the constant-time comparison in verify_api_key
+API_KEY_BYTES = API_KEY.encode("utf-8")
 security = HTTPBearer()
 
 
 def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify the provided API key."""
-    if credentials.credentials != API_KEY:
+    if not hmac.compare_digest(
+        credentials.credentials.encode("utf-8"), API_KEY_BYTES
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -52,21 +60,68 @@ class LocationsResponse(BaseModel):
     total_count: int
 
 
+# Popular routes repeat and the map is static, so path results are memoized;
+# 1024 entries hold every one of the 23 x 23 location pairs.
+# Cached lists/dicts are shared between requests and must not be mutated.
+cached_path_with_turns = lru_cache(maxsize=1024)(get_path_with_turns)
+
+
+@lru_cache(maxsize=1)
+def get_locations_response() -> LocationsResponse:
+    """Build the (static) locations response once and reuse it."""
+    locations = get_available_locations()
+    return LocationsResponse(
+        buildings=locations["buildings"],
+        street_nodes=locations["street_nodes"],
+        all_locations=locations["all_locations"],
+        total_count=len(locations["all_locations"]),
+    )
+
+
+# Every location on the map; other names are answered without the path memo
+KNOWN_LOCATIONS = frozenset(get_locations_response().all_locations)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Fill the path and locations caches for every location pair at startup."""
+    locations = get_locations_response().all_locations
+    for start in locations:
+        for end in locations:
+            cached_path_with_turns(start, end)
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Simple Path Tool API",
     description="API for pathfinding with turn instructions using default city map. Requires Bearer token authentication for protected endpoints.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Create router for /simpletool endpoints
-router = APIRouter(prefix="/simpletool", tags=["pathfinding"])
+router = APIRouter(
+    prefix="/simpletool",
+    tags=["pathfinding"],
+    default_response_class=ORJSONResponse,
+)
+
+# Allowed CORS origins, comma-separated (default: the local web frontend);
+# "*" allows any origin, but then without credentials
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+)
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
+    # Credentialed requests only from an explicit origin list, never from "*"
+    allow_credentials="*" not in CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -110,13 +165,7 @@ async def health_check():
 async def get_locations():
     """Get all available locations in the city map."""
     try:
-        locations = get_available_locations()
-        return LocationsResponse(
-            buildings=locations["buildings"],
-            street_nodes=locations["street_nodes"],
-            all_locations=locations["all_locations"],
-            total_count=len(locations["all_locations"]),
-        )
+        return get_locations_response()
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error getting locations: {str(e)}"
@@ -137,8 +186,12 @@ async def get_path(request: PathRequest, api_key: str = Depends(verify_api_key))
                 status_code=400, detail="Both start and end locations are required"
             )
 
-        # Get path with turns
-        path, edges = get_path_with_turns(request.start, request.end)
+        # Get path with turns; unknown names never reach the memo, so client
+        # input cannot evict the location pairs warmed at startup
+        if request.start in KNOWN_LOCATIONS and request.end in KNOWN_LOCATIONS:
+            path, edges = cached_path_with_turns(request.start, request.end)
+        else:
+            path, edges = None, None
 
         if path is None or edges is None:
             return PathResponse(
@@ -173,7 +226,7 @@ async def get_path_get(start: str, end: str, api_key: str = Depends(verify_api_k
 @router.get("/path/example")
 async def get_example_path():
     """Get an example path for testing."""
-    path, edges = get_path_with_turns("Police Station", "Bakery")
+    path, edges = cached_path_with_turns("Police Station", "Bakery")
 
     return {
         "example": "Police Station to Bakery",
@@ -189,15 +242,13 @@ async def get_example_path():
 @router.get("/buildings")
 async def get_buildings():
     """Get just the building names."""
-    locations = get_available_locations()
-    return {"buildings": locations["buildings"]}
+    return {"buildings": get_locations_response().buildings}
 
 
 @router.get("/streets")
 async def get_street_nodes():
     """Get just the street node names."""
-    locations = get_available_locations()
-    return {"street_nodes": locations["street_nodes"]}
+    return {"street_nodes": get_locations_response().street_nodes}
 
 
 # Include the router in the app
@@ -0,0 +1,125 @@
+"""
+Map Search Helpers
+
+Breadth-first search, per-graph lookup tables and the turn table for the
+city map. Used by path_tool here and by Path/city_map.py, so there is a
+single implementation; it lives in this directory because the path tool's
+Docker image is built from it alone.
+"""
+
+import weakref
+from collections import deque
+
+import networkx as nx
+
+
+# Heading for the reverse direction of every connection
+OPPOSITE = {"North": "South", "South": "North", "East": "West", "West": "East"}
+
+
+# Tables derived from a frozen graph, keyed on the graph object itself. They
+# are kept off G.graph because G.copy() and nx.DiGraph(G) copy that dict
+# into graphs that can then be edited.
+_GRAPH_CACHES = weakref.WeakKeyDictionary()
+
+
+def cached(G, name, build):
+    """
+    Return build(G), built once per graph object when G is frozen.
+
+    An unfrozen graph may still change, so its table is rebuilt every call.
+    """
+    if not nx.is_frozen(G):
+        return build(G)
+    cache = _GRAPH_CACHES.setdefault(G, {})
+    if name not in cache:
+        cache[name] = build(G)
+    return cache[name]
+
+
+def _bfs_predecessors(adj, source):
+    """
+    Breadth-first predecessors from source over an adjacency mapping.
+
+    previous[node] is the node just before node on the shortest path from
+    source (None for source itself); unreachable nodes are absent.
+    """
+    previous = {source: None}
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        for neighbor in adj[current]:
+            if neighbor not in previous:
+                previous[neighbor] = current
+                queue.append(neighbor)
+    return previous
+
+
+def _predecessor_table(G):
+    """All-pairs predecessor table: source -> _bfs_predecessors(source)."""
+    adj = G._adj
+    return {source: _bfs_predecessors(adj, source) for source in adj}
+
+
+def predecessors(G, source):
+    """
+    Predecessors from source (see _bfs_predecessors), or None if source is
+    not in G. A frozen map's table is built for every source at once and
+    cached; any other graph is searched from source on each call.
+    """
+    if nx.is_frozen(G):
+        return cached(G, "predecessors", _predecessor_table).get(source)
+    if source not in G._adj:
+        return None
+    return _bfs_predecessors(G._adj, source)
+
+
+def shortest_path(G, start, end):
+    """
+    Shortest path from start to end over the unweighted graph, walked back
+    from the BFS predecessors; None when there is no path or either node is
+    not in G.
+    """
+    previous = predecessors(G, start)
+    if previous is None or end not in previous:
+        return None
+
+    path = []
+    while end is not None:
+        path.append(end)
+        end = previous[end]
+    path.reverse()
+    return path
+
+
+# Compass directions as indices into _TURNS
+_DIRECTION_INDEX = {"North": 0, "South": 1, "East": 2, "West": 3}
+
+# _TURNS[facing][target]: turn needed to face target from facing
+_TURNS = (
+    ("straight", "around", "right", "left"),  # facing North
+    ("around", "straight", "left", "right"),  # facing South
+    ("left", "right", "straight", "around"),  # facing East
+    ("right", "left", "around", "straight"),  # facing West
+)
+
+
+def get_turn(facing, target):
+    """
+    Turn needed to face target when currently facing another direction.
+
+    Args:
+        facing (str): Current compass direction
+        target (str): Compass direction to face next
+
+    Returns:
+        str: 'straight', 'left', 'right' or 'around'; 'unknown' if either
+        direction is not a compass direction
+    """
+    if facing == target:
+        return "straight"
+    facing_index = _DIRECTION_INDEX.get(facing)
+    target_index = _DIRECTION_INDEX.get(target)
+    if facing_index is None or target_index is None:
+        return "unknown"
+    return _TURNS[facing_index][target_index]
@@ -4,123 +4,152 @@ Simple Path Tool with Turn Instructions
 Core module for pathfinding with turn instructions using the default city map.
 """
 
+from functools import lru_cache
+
 import networkx as nx
-import numpy as np
-import matplotlib.pyplot as plt
 from typing import List, Dict, Tuple, Optional
 
+from map_search import OPPOSITE, cached, get_turn, shortest_path
+
+
+# Buildings and street nodes in the system
+_BUILDING_NODES = (
+    "Post Office",
+    "Train Station",
+    "Book Shop",
+    "Hospital",
+    "Church",
+    "Police Station",
+    "Sports Centre",
+    "Bank",
+    "Fire Station",
+    "Supermarket",
+    "Bakery",
+    "Clinic",
+)
+
+_STREET_NODES = (
+    "W1",
+    "W2",
+    "W3",
+    "W4",
+    "W5",  # West Street
+    "N1",
+    "N2",
+    "N3",  # North Street
+    "E1",
+    "E2",
+    "E3",  # East Street
+)
+
+# Membership sets for classifying nodes (e.g. in print_edges.py)
+BUILDINGS = frozenset(_BUILDING_NODES)
+STREET_NODES = frozenset(_STREET_NODES)
+
+# Bidirectional connections: (from_node, to_node, from_to_direction); the
+# reverse edge's direction is derived from OPPOSITE
+_CONNECTIONS = (
+    # Building-to-street connections
+    ("Post Office", "W5", "East"),
+    ("Train Station", "W5", "West"),
+    ("Book Shop", "W4", "West"),
+    ("Hospital", "W3", "West"),
+    ("Church", "W3", "East"),
+    ("Police Station", "W1", "East"),
+    ("Sports Centre", "N1", "South"),
+    ("Bank", "N2", "South"),
+    ("Fire Station", "N3", "South"),
+    ("Supermarket", "E1", "West"),
+    ("Bakery", "E2", "West"),
+    ("Clinic", "E3", "West"),
+    # Street connections
+    ("W1", "W2", "South"),
+    ("W2", "W3", "South"),
+    ("W3", "W4", "South"),
+    ("W4", "W5", "South"),
+    ("N1", "N2", "East"),
+    ("N2", "N3", "East"),
+    ("E1", "E2", "South"),
+    ("E2", "E3", "South"),
+    # Inter-street connections
+    ("W2", "N1", "East"),
+    ("N2", "E1", "South"),
+    # Building adjacencies
+    # ("Post Office", "Train Station", "East"),
+    # ("Hospital", "Church", "West"),
+    # ("Post Office", "Church", "North"),
+    # ("Church", "Police Station", "North"),
+    # ("Train Station", "Book Shop", "North"),
+    # ("Book Shop", "Hospital", "North"),
+    # ("Sports Centre", "Bank", "East"),
+    # ("Bank", "Fire Station", "East"),
+    # ("Supermarket", "Bakery", "South"),
+    # ("Bakery", "Clinic", "South"),
+)
+
 
 def create_city_map():
-    """Create the default city map with bidirectional edges and directional labels."""
-
-    # Define all nodes in the system
-    node_names = [
-        # Buildings
-        "Post Office",
-        "Train Station",
-        "Book Shop",
-        "Hospital",
-        "Church",
-        "Police Station",
-        "Sports Centre",
-        "Bank",
-        "Fire Station",
-        "Supermarket",
-        "Bakery",
-        "Clinic",
-        # Street nodes
-        "W1",
-        "W2",
-        "W3",
-        "W4",
-        "W5",  # West Street
-        "N1",
-        "N2",
-        "N3",  # North Street
-        "E1",
-        "E2",
-        "E3",  # East Street
-    ]
+    """
+    Create the default city map with bidirectional edges and directional labels.
+
+    The returned graph is frozen (nx.freeze), so it can be shared safely.
+    """
 
     # Create directed graph with edge labels
     G = nx.DiGraph()
-    G.add_nodes_from(node_names)
+    G.add_nodes_from(_BUILDING_NODES + _STREET_NODES)
+
+    # Both directions of every connection in a single add_edges_from call
+    G.add_edges_from(
+        edge
+        for from_node, to_node, direction in _CONNECTIONS
+        for edge in (
+            (from_node, to_node, {"direction": direction}),
+            (to_node, from_node, {"direction": OPPOSITE[direction]}),
+        )
+    )
 
-    def add_bidirectional_edge(
-        from_node, to_node, from_to_direction, to_from_direction
-    ):
-        G.add_edge(from_node, to_node, direction=from_to_direction)
-        G.add_edge(to_node, from_node, direction=to_from_direction)
+    # Frozen: the map is static, and pathfinding iterates G._adj directly
+    return nx.freeze(G)
 
-    # Building-to-street connections
-    add_bidirectional_edge("Post Office", "W5", "East", "West")
-    add_bidirectional_edge("Train Station", "W5", "West", "East")
-    add_bidirectional_edge("Book Shop", "W4", "West", "East")
-    add_bidirectional_edge("Hospital", "W3", "West", "East")
-    add_bidirectional_edge("Church", "W3", "East", "West")
-    add_bidirectional_edge("Police Station", "W1", "East", "West")
-    add_bidirectional_edge("Sports Centre", "N1", "South", "North")
-    add_bidirectional_edge("Bank", "N2", "South", "North")
-    add_bidirectional_edge("Fire Station", "N3", "South", "North")
-    add_bidirectional_edge("Supermarket", "E1", "West", "East")
-    add_bidirectional_edge("Bakery", "E2", "West", "East")
-    add_bidirectional_edge("Clinic", "E3", "West", "East")
 
-    # Street connections
-    add_bidirectional_edge("W1", "W2", "South", "North")
-    add_bidirectional_edge("W2", "W3", "South", "North")
-    add_bidirectional_edge("W3", "W4", "South", "North")
-    add_bidirectional_edge("W4", "W5", "South", "North")
-    add_bidirectional_edge("N1", "N2", "East", "West")
-    add_bidirectional_edge("N2", "N3", "East", "West")
-    add_bidirectional_edge("E1", "E2", "South", "North")
-    add_bidirectional_edge("E2", "E3", "South", "North")
+@lru_cache(maxsize=1)
+def _graph():
+    """Build the (frozen) city map once and share it between calls."""
+    return create_city_map()
 
-    # Inter-street connections
-    add_bidirectional_edge("W2", "N1", "East", "West")
-    add_bidirectional_edge("N2", "E1", "South", "North")
 
-    # Building adjacencies
-    #add_bidirectional_edge("Post Office", "Train Station", "East", "West")
-    #add_bidirectional_edge("Hospital", "Church", "West", "East")
-    #add_bidirectional_edge("Post Office", "Church", "North", "South")
-    #add_bidirectional_edge("Church", "Police Station", "North", "South")
-    #add_bidirectional_edge("Train Station", "Book Shop", "North", "South")
-    #add_bidirectional_edge("Book Shop", "Hospital", "North", "South")
-    #add_bidirectional_edge("Sports Centre", "Bank", "East", "West")
-    #add_bidirectional_edge("Bank", "Fire Station", "East", "West")
-    #add_bidirectional_edge("Supermarket", "Bakery", "South", "North")
-    #add_bidirectional_edge("Bakery", "Clinic", "South", "North")
+def _direction_table(G):
+    """(from, to) -> direction label for every edge."""
+    return {
+        (u, v): data.get("direction", "Unknown") for u, v, data in G.edges(data=True)
+    }
 
-    return G
+
+def _edge_directions(G):
+    """Direction table for G; the frozen map's table is built only once."""
+    return cached(G, "directions", _direction_table)
 
 
 def find_path_with_edges(G, start, end):
     """Find shortest path with complete edge information."""
-    try:
-        path = nx.dijkstra_path(G, start, end)
-        path_edges = []
-
-        for i in range(len(path) - 1):
-            current = path[i]
-            next_node = path[i + 1]
-            edge_data = G.get_edge_data(current, next_node)
-            path_edges.append(
-                {
-                    "from": current,
-                    "to": next_node,
-                    "direction": (
-                        edge_data.get("direction", "Unknown")
-                        if edge_data
-                        else "Unknown"
-                    ),
-                }
-            )
-
-        return path, path_edges
-    except nx.NetworkXNoPath:
+    # None for unknown locations (common API input) as well as unreachable ones
+    path = shortest_path(G, start, end)
+    if path is None:
         return None, None
 
+    # Every consecutive pair is an edge, so the direction table always hits
+    directions = _edge_directions(G)
+    path_edges = [
+        {
+            "from": current,
+            "to": next_node,
+            "direction": directions[current, next_node],
+        }
+        for current, next_node in zip(path, path[1:])
+    ]
+    return path, path_edges
+
 
 class FacingState:
     """Simple class to track facing directions and calculate turns."""
@@ -132,26 +161,9 @@ class FacingState:
 
     def turn_to(self, target):
         """Calculate turn instruction to face target direction."""
-        if self.current == target:
-            return "straight"
         if self.current is None:
             return "start"
-
-        turns = {
-            ("North", "East"): "right",
-            ("North", "South"): "around",
-            ("North", "West"): "left",
-            ("East", "South"): "right",
-            ("East", "West"): "around",
-            ("East", "North"): "left",
-            ("South", "West"): "right",
-            ("South", "North"): "around",
-            ("South", "East"): "left",
-            ("West", "North"): "right",
-            ("West", "East"): "around",
-            ("West", "South"): "left",
-        }
-        return turns.get((self.current, target), "unknown")
+        return get_turn(self.current, target)
 
 
 def get_path_with_turns(
@@ -167,8 +179,7 @@ def get_path_with_turns(
     Returns:
         Tuple of (path_nodes, edges_with_turns) or (None, None) if no path
     """
-    # Create city map
-    G = create_city_map()
+    G = _graph()
 
     # Find path with edges
     path, edges = find_path_with_edges(G, start, end)
@@ -187,29 +198,12 @@ def get_path_with_turns(
 
 def get_available_locations() -> Dict[str, List[str]]:
     """Get all available locations in the city map."""
-    G = create_city_map()
-
-    buildings = [
-        "Post Office",
-        "Train Station",
-        "Book Shop",
-        "Hospital",
-        "Church",
-        "Police Station",
-        "Sports Centre",
-        "Bank",
-        "Fire Station",
-        "Supermarket",
-        "Bakery",
-        "Clinic",
-    ]
-
-    street_nodes = ["W1", "W2", "W3", "W4", "W5", "N1", "N2", "N3", "E1", "E2", "E3"]
-
+    # Fresh lists from the module-level node tuples; all_locations follows the
+    # graph's node order (buildings first, as added in create_city_map)
     return {
-        "buildings": buildings,
-        "street_nodes": street_nodes,
-        "all_locations": list(G.nodes()),
+        "buildings": list(_BUILDING_NODES),
+        "street_nodes": list(_STREET_NODES),
+        "all_locations": list(_BUILDING_NODES + _STREET_NODES),
     }
 
 
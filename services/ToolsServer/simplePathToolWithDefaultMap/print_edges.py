@@ -2,7 +2,7 @@
 View all bidirectional edges with direction information
 """
 
-from path_tool import create_city_map
+from path_tool import BUILDINGS, STREET_NODES, create_city_map
 
 def print_bidirectional_edges():
     """Print all bidirectional edges with their direction labels"""
@@ -11,73 +11,70 @@ def print_bidirectional_edges():
     print("🗺️ Bidirectional Edges with Direction Information")
     print("=" * 60)
     
-    # Get all unique pairs (undirected edges)
-    seen_pairs = set()
-    edges_info = []
-    
+    # Each connection is stored as two directed edges; G.edges() meets a pair
+    # first at whichever endpoint was added earlier, so keep only that
+    # orientation and sort every pair into its section in the same pass
+    node_order = {node: index for index, node in enumerate(G)}
+    building_to_street = []
+    street_to_street = []
+    building_to_building = []
+
     for from_node, to_node, data in G.edges(data=True):
-        # Create a sorted pair to avoid duplicates
-        pair = tuple(sorted([from_node, to_node]))
-        
-        if pair not in seen_pairs:
-            seen_pairs.add(pair)
-            
-            # Get both directions
-            dir1 = G[from_node][to_node]['direction']
-            dir2 = G[to_node][from_node]['direction']
-            
-            edges_info.append({
-                'node1': from_node,
-                'node2': to_node,
-                'dir1': dir1,
-                'dir2': dir2
-            })
-    
+        if node_order[from_node] > node_order[to_node]:
+            continue
+
+        edge = {
+            'node1': from_node,
+            'node2': to_node,
+            'dir1': data['direction'],
+            'dir2': G[to_node][from_node]['direction']
+        }
+
+        if from_node in BUILDINGS:
+            if to_node in BUILDINGS:
+                building_to_building.append(edge)
+            elif to_node in STREET_NODES:
+                building_to_street.append(edge)
+        elif from_node in STREET_NODES:
+            if to_node in STREET_NODES:
+                street_to_street.append(edge)
+            elif to_node in BUILDINGS:
+                building_to_street.append(edge)
+
     # Sort by node names for better readability
-    edges_info.sort(key=lambda x: (x['node1'], x['node2']))
-    
+    for section in (building_to_street, street_to_street, building_to_building):
+        section.sort(key=lambda x: (x['node1'], x['node2']))
+
+    def print_edge(edge):
+        print(f"{edge['node1']} ↔ {edge['node2']}")
+        print(f"  {edge['node1']} → {edge['node2']}: {edge['dir1']}")
+        print(f"  {edge['node2']} → {edge['node1']}: {edge['dir2']}")
+        print()
+
     # Print in organized sections
     print("📍 BUILDING-TO-STREET CONNECTIONS:")
     print("-" * 40)
-    buildings = ["Post Office", "Train Station", "Book Shop", "Hospital", 
-                "Church", "Police Station", "Sports Centre", "Bank", 
-                "Fire Station", "Supermarket", "Bakery", "Clinic"]
-    
-    for edge in edges_info:
-        if (edge['node1'] in buildings and edge['node2'].startswith(('W', 'N', 'E'))) or \
-           (edge['node2'] in buildings and edge['node1'].startswith(('W', 'N', 'E'))):
-            print(f"{edge['node1']} ↔ {edge['node2']}")
-            print(f"  {edge['node1']} → {edge['node2']}: {edge['dir1']}")
-            print(f"  {edge['node2']} → {edge['node1']}: {edge['dir2']}")
-            print()
+    for edge in building_to_street:
+        print_edge(edge)
     
     print("🛣️ STREET-TO-STREET CONNECTIONS:")
     print("-" * 40)
-    for edge in edges_info:
-        if edge['node1'].startswith(('W', 'N', 'E')) and edge['node2'].startswith(('W', 'N', 'E')):
-            print(f"{edge['node1']} ↔ {edge['node2']}")
-            print(f"  {edge['node1']} → {edge['node2']}: {edge['dir1']}")
-            print(f"  {edge['node2']} → {edge['node1']}: {edge['dir2']}")
-            print()
+    for edge in street_to_street:
+        print_edge(edge)
     
     print("🏢 BUILDING-TO-BUILDING CONNECTIONS:")
     print("-" * 40)
-    building_to_building = []
-    for edge in edges_info:
-        if edge['node1'] in buildings and edge['node2'] in buildings:
-            building_to_building.append(edge)
-    
     if building_to_building:
         for edge in building_to_building:
-            print(f"{edge['node1']} ↔ {edge['node2']}")
-            print(f"  {edge['node1']} → {edge['node2']}: {edge['dir1']}")
-            print(f"  {edge['node2']} → {edge['node1']}: {edge['dir2']}")
-            print()
+            print_edge(edge)
     else:
         print("  No direct building-to-building connections (commented out)")
     
     print(f"\n📊 SUMMARY:")
-    print(f"Total bidirectional connections: {len(edges_info)}")
+    total_connections = (
+        len(building_to_street) + len(street_to_street) + len(building_to_building)
+    )
+    print(f"Total bidirectional connections: {total_connections}")
     print(f"Total directed edges in graph: {G.number_of_edges()}")
 
 if __name__ == "__main__":
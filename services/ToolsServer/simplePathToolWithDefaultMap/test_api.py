@@ -5,7 +5,9 @@ Simple test script for the Path Tool API
 import requests
 import json
 import os
+import socket
 from pathlib import Path
+from urllib.parse import urlparse
 
 
 # API Key for testing
@@ -19,88 +21,100 @@ def test_api(base_url="http://localhost:8001/simpletool"):
     print(f"Testing API at {base_url}")
     print("=" * 50)
 
-    # Test health endpoint
+    # Probe the server once so a down server fails fast instead of per request
+    url = urlparse(base_url)
+    port = url.port or (443 if url.scheme == "https" else 80)
     try:
-        response = requests.get(f"{base_url}/health")
-        print(f"Health Check: {response.status_code} - {response.json()}")
-    except Exception as e:
-        print(f"Health Check Failed: {e}")
+        socket.create_connection((url.hostname, port), timeout=0.5).close()
+    except OSError as e:
+        print(f"Could not connect to API server at {url.hostname}:{port}: {e}")
+        print("Make sure the server is running (python main.py or docker-compose up)")
         return False
 
-    # Test locations endpoint
-    try:
-        response = requests.get(f"{base_url}/locations")
-        data = response.json()
-        print(f"Locations: Found {data['total_count']} total locations")
-        print(f"  Buildings: {len(data['buildings'])}")
-        print(f"  Street Nodes: {len(data['street_nodes'])}")
-    except Exception as e:
-        print(f"Locations Failed: {e}")
-
-    # Test path endpoint (POST) - Without Authentication
-    try:
-        path_request = {"start": "Police Station", "end": "Bakery"}
-        response = requests.post(f"{base_url}/path", json=path_request)
-        if response.status_code == 401:
-            print(f"\nPath Finding (POST) - No Auth: CORRECTLY REJECTED (401)")
-        else:
-            print(
-                f"\nPath Finding (POST) - No Auth: UNEXPECTED RESPONSE ({response.status_code})"
-            )
-    except Exception as e:
-        print(f"Path Finding (No Auth) Failed: {e}")
-
-    # Test path endpoint (POST) - With Authentication
-    try:
-        path_request = {"start": "Police Station", "end": "Bakery"}
-        response = requests.post(
-            f"{base_url}/path", json=path_request, headers=AUTH_HEADERS
-        )
-        data = response.json()
-
-        if response.status_code == 200 and data["success"]:
-            print(f"\nPath Finding (POST) - With Auth: SUCCESS")
-            print(f"  Path: {' → '.join(data['path'])}")
-            print(f"  Steps: {data['total_steps']}")
-            print("  Turn Instructions:")
-            for i, edge in enumerate(data["edges"]):
+    # One keep-alive session so every request reuses the same connection
+    with requests.Session() as session:
+        # Test health endpoint
+        try:
+            response = session.get(f"{base_url}/health")
+            print(f"Health Check: {response.status_code} - {response.json()}")
+        except Exception as e:
+            print(f"Health Check Failed: {e}")
+            return False
+
+        # Test locations endpoint
+        try:
+            response = session.get(f"{base_url}/locations")
+            data = response.json()
+            print(f"Locations: Found {data['total_count']} total locations")
+            print(f"  Buildings: {len(data['buildings'])}")
+            print(f"  Street Nodes: {len(data['street_nodes'])}")
+        except Exception as e:
+            print(f"Locations Failed: {e}")
+
+        # Test path endpoint (POST) - Without Authentication
+        try:
+            path_request = {"start": "Police Station", "end": "Bakery"}
+            response = session.post(f"{base_url}/path", json=path_request)
+            if response.status_code == 401:
+                print(f"\nPath Finding (POST) - No Auth: CORRECTLY REJECTED (401)")
+            else:
                 print(
-                    f"    {i+1}. {edge['turn']} → {edge['direction']} to {edge['to']}"
+                    f"\nPath Finding (POST) - No Auth: UNEXPECTED RESPONSE ({response.status_code})"
                 )
-        else:
-            print(
-                f"Path Finding (With Auth) Failed: {data.get('message') if 'data' in locals() else response.status_code}"
+        except Exception as e:
+            print(f"Path Finding (No Auth) Failed: {e}")
+
+        # Test path endpoint (POST) - With Authentication
+        try:
+            path_request = {"start": "Police Station", "end": "Bakery"}
+            response = session.post(
+                f"{base_url}/path", json=path_request, headers=AUTH_HEADERS
             )
-    except Exception as e:
-        print(f"Path Finding Failed: {e}")
+            data = response.json()
+
+            if response.status_code == 200 and data["success"]:
+                print(f"\nPath Finding (POST) - With Auth: SUCCESS")
+                print(f"  Path: {' → '.join(data['path'])}")
+                print(f"  Steps: {data['total_steps']}")
+                print("  Turn Instructions:")
+                for i, edge in enumerate(data["edges"]):
+                    print(
+                        f"    {i+1}. {edge['turn']} → {edge['direction']} to {edge['to']}"
+                    )
+            else:
+                print(
+                    f"Path Finding (With Auth) Failed: {data.get('message') if 'data' in locals() else response.status_code}"
+                )
+        except Exception as e:
+            print(f"Path Finding Failed: {e}")
 
-    # Test path endpoint (GET) - With Authentication
-    try:
-        response = requests.get(
-            f"{base_url}/path/Hospital/Library", headers=AUTH_HEADERS
-        )
-        data = response.json()
-
-        if response.status_code == 200 and data["success"]:
-            print(f"\nPath Finding (GET) - With Auth: SUCCESS")
-            print(f"  Path: {' → '.join(data['path'])}")
-        else:
-            print(
-                f"Path Finding (GET) Failed: {data.get('message') if 'data' in locals() else response.status_code}"
+        # Test path endpoint (GET) - With Authentication
+        try:
+            response = session.get(
+                f"{base_url}/path/Hospital/Library", headers=AUTH_HEADERS
             )
-    except Exception as e:
-        print(f"Path Finding (GET) Failed: {e}")
+            data = response.json()
 
-    # Test example endpoint
-    try:
-        response = requests.get(f"{base_url}/path/example")
-        data = response.json()
-        print(f"\nExample Path: {data['example']}")
-        print(f"  Formatted Instructions:")
-        for instruction in data["formatted_instructions"]:
-            print(f"    {instruction}")
-    except Exception as e:
-        print(f"Example Failed: {e}")
+            if response.status_code == 200 and data["success"]:
+                print(f"\nPath Finding (GET) - With Auth: SUCCESS")
+                print(f"  Path: {' → '.join(data['path'])}")
+            else:
+                print(
+                    f"Path Finding (GET) Failed: {data.get('message') if 'data' in locals() else response.status_code}"
+                )
+        except Exception as e:
+            print(f"Path Finding (GET) Failed: {e}")
+
+        # Test example endpoint
+        try:
+            response = session.get(f"{base_url}/path/example")
+            data = response.json()
+            print(f"\nExample Path: {data['example']}")
+            print(f"  Formatted Instructions:")
+            for instruction in data["formatted_instructions"]:
+                print(f"    {instruction}")
+        except Exception as e:
+            print(f"Example Failed: {e}")
 
     print("\n" + "=" * 50)
     print("Testing complete!")
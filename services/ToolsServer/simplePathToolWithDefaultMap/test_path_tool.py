@@ -0,0 +1,38 @@
+"""path_tool on edited copies of the frozen default map"""
+
+from path_tool import _graph, find_path_with_edges
+
+
+def test_paths_on_edited_copy():
+    """Paths on an edited copy avoid the removed connection"""
+    G = _graph()
+    path, _ = find_path_with_edges(G, "Police Station", "Bakery")
+    assert path[2:4] == ["W2", "N1"]
+
+    copy = G.copy()
+    copy.remove_edge("W2", "N1")
+    # W2-N1 was the only way from West Street towards the bakery
+    assert find_path_with_edges(copy, "Police Station", "Bakery") == (None, None)
+    path, _ = find_path_with_edges(copy, "W1", "W3")
+    assert path == ["W1", "W2", "W3"]
+
+    # The original map still routes through W2-N1
+    path, _ = find_path_with_edges(G, "Police Station", "Bakery")
+    assert path[2:4] == ["W2", "N1"]
+
+
+def test_directions_on_edited_copy():
+    """Edge directions on an edited copy reflect its own edge data"""
+    G = _graph()
+    _, edges = find_path_with_edges(G, "W1", "W2")
+    assert edges[0]["direction"] == "South"
+
+    copy = G.copy()
+    copy["W1"]["W2"]["direction"] = "Down"
+    _, edges = find_path_with_edges(copy, "W1", "W2")
+    assert edges[0]["direction"] == "Down"
+
+    # The original map keeps its label
+    _, edges = find_path_with_edges(G, "W1", "W2")
+    assert edges[0]["direction"] == "South"
+
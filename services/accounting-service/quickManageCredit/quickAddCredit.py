@@ -4,23 +4,39 @@ User Management Script for Simple Authentication System
 This script creates an admin user, promotes it to admin role, and uses it to create supervisors and regular users.
 """
 
+import base64
 import json
 import requests
 import subprocess
-import time
 import sys
+import time
 import os
 import datetime
 import urllib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 LOG_FILE = "add_credits.log"
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 LOG_PATH = os.path.join(SCRIPT_DIR, LOG_FILE)
+# Admin JWT kept between runs; delete it to force a fresh login
+TOKEN_CACHE_PATH = os.path.join(SCRIPT_DIR, ".admin_token.json")
+# Cached tokens this close to expiry are not reused
+TOKEN_EXPIRY_MARGIN = 30
 
 # Configuration
 API_BASE_URL = "http://localhost:3000"
 ACCOUNT_BASE_URL = "http://localhost:3001"
 
+# Users are processed concurrently; allocations are independent requests
+MAX_WORKERS = 8
+# Set QAC_DEBUG=1 to print full request/response dumps
+DEBUG = os.getenv("QAC_DEBUG") == "1"
+# Serializes writes to the shared log file handle from the worker threads
+LOG_LOCK = threading.Lock()
+
 MONGODB_CONTAINER = "auth-mongodb"
 ADMIN_USER = {
     "username": "admin",
@@ -57,12 +73,89 @@ REGULAR_USERS = [
 ]
 
 
+def create_session():
+    """
+    Create a shared HTTP session so every request reuses kept-alive connections.
+
+    Failed connection attempts are retried with exponential backoff; GETs are
+    also retried on 502/503/504. POSTs are never re-sent once they have
+    reached the server, so a credit allocation cannot be applied twice.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_token_expiry(token):
+    """Return the 'exp' claim of a JWT (seconds since epoch), or None"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        exp = claims.get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    # A non-numeric claim is treated like a missing one
+    if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+        return None
+    return exp
+
+
+def load_cached_admin_token():
+    """Return the cached admin token if it is not about to expire"""
+    try:
+        with open(TOKEN_CACHE_PATH) as cache_file:
+            cached = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    token = cached.get("token") if isinstance(cached, dict) else None
+    exp = get_token_expiry(token) if isinstance(token, str) else None
+    if exp is not None and exp - time.time() > TOKEN_EXPIRY_MARGIN:
+        return token
+    return None
+
+
+def discard_cached_admin_token():
+    """Delete the cached admin token so the next login is a fresh one"""
+    try:
+        os.remove(TOKEN_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"⚠️ Could not remove cached admin token: {e}")
+
+
+class AdminTokenRejected(Exception):
+    """An admin request was answered with 401 Unauthorized"""
+
+
+def save_admin_token(token):
+    """Cache the admin token for later runs, readable by the owner only"""
+    exp = get_token_expiry(token)
+    if exp is None:
+        return  # Not a JWT we can check for expiry; don't cache it
+    try:
+        fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump({"token": token, "exp": exp}, cache_file)
+    except OSError as e:
+        print(f"⚠️ Could not cache admin token: {e}")
+
+
 # ADD Credit to Supervisor and Regular Users using the Admin User credentials
-def get_admin_token():
-    """Log in as admin and get the access token"""
+def get_admin_token(session, log_file):
+    """Log in as admin and get the access token (reusing a cached one if valid)"""
     print("\n--- Getting admin access token ---")
+    token = load_cached_admin_token()
+    if token:
+        print("✅ Reusing cached admin access token")
+        return token
+
     try:
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/api/auth/login",
             json={
                 "username": ADMIN_USER["username"],
@@ -81,7 +174,8 @@ def get_admin_token():
             # If still no token, check for other formats based on API response
             if not token and isinstance(data, dict):
                 # Print response structure for debugging
-                print(f"Response structure: {json.dumps(data, indent=2)}")
+                if DEBUG:
+                    print(f"Response structure: {json.dumps(data, indent=2)}")
 
                 # Try to find any key that might contain the token
                 for key, value in data.items():
@@ -92,12 +186,12 @@ def get_admin_token():
 
             if token:
                 print("✅ Admin access token obtained")
+                save_admin_token(token)
                 # Log successful login
-                with open(LOG_PATH, "a") as log_file:
-                    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    log_file.write(
-                        f"[{timestamp}] Admin '{ADMIN_USER['username']}' logged in successfully\n"
-                    )
+                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                log_file.write(
+                    f"[{timestamp}] Admin '{ADMIN_USER['username']}' logged in successfully\n"
+                )
                 return token
             else:
                 print("❌ Access token not found in response")
@@ -112,16 +206,22 @@ def get_admin_token():
     return None
 
 from typing import Dict, Optional, Any
-def get_user_by_email(email: str, admin_token: str) -> Optional[Dict[str, Any]]:
+def get_user_by_email(
+    email: str, admin_token: str, session: requests.Session
+) -> Optional[Dict[str, Any]]:
     """
     Test the GET /api/admin/users/by-email/:email endpoint
     
     Args:
         email: User's email address
         admin_token: Admin JWT token for authentication
+        session: Shared HTTP session from create_session()
         
     Returns:
         Dict containing user info, or None if not found/error
+
+    Raises:
+        AdminTokenRejected: if the admin token is rejected (401)
     """
     print(f"\nTesting GET /api/admin/users/by-email/{email}")
     
@@ -139,15 +239,17 @@ def get_user_by_email(email: str, admin_token: str) -> Optional[Dict[str, Any]]:
         print(f"Making request to: {url}")
         print(f"Headers: Authorization: Bearer {admin_token[:20]}...")
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = session.get(url, headers=headers, timeout=10)
         
         print(f"Response Status: {response.status_code}")
-        print(f"Response Headers: {dict(response.headers)}")
+        if DEBUG:
+            print(f"Response Headers: {dict(response.headers)}")
         
         if response.status_code == 200:
             data = response.json()
             print("✅ Request successful!")
-            print(f"Response: {json.dumps(data, indent=2)}")
+            if DEBUG:
+                print(f"Response: {json.dumps(data, indent=2)}")
             
             # Extract user data
             user_data = data.get('user')
@@ -176,7 +278,7 @@ def get_user_by_email(email: str, admin_token: str) -> Optional[Dict[str, Any]]:
             
         elif response.status_code == 401:
             print("❌ Unauthorized - check admin token")
-            return None
+            raise AdminTokenRejected(url)
             
         elif response.status_code == 403:
             print("❌ Forbidden - admin access required")
@@ -191,12 +293,12 @@ def get_user_by_email(email: str, admin_token: str) -> Optional[Dict[str, Any]]:
         print(f"❌ Request failed: {e}")
         return None
 
-def create_user_account(admin_token, sub, email, role, username=None):
+def create_user_account(session, admin_token, sub, email, role, username=None):
     """
     Creates a new user account by calling the /api/admin/users endpoint.
 
     Args:
-        base_url (str): The base URL of the accounting service.
+        session (requests.Session): Shared HTTP session from create_session().
         admin_token (str): The JWT token for an admin user.
         sub (str): The unique ID (sub/subject) for the new user.
         email (str): The email address for the new user.
@@ -224,11 +326,12 @@ def create_user_account(admin_token, sub, email, role, username=None):
     if username:
         payload["username"] = username
 
-    print(f"Attempting to create user with payload: {json.dumps(payload, indent=2)}")
+    if DEBUG:
+        print(f"Attempting to create user with payload: {json.dumps(payload, indent=2)}")
     print(f"Target URL: {create_user_url}")
 
     try:
-        response = requests.post(create_user_url, headers=headers, json=payload)
+        response = session.post(create_user_url, headers=headers, json=payload)
         
         response_data = None
         try:
@@ -243,7 +346,7 @@ def create_user_account(admin_token, sub, email, role, username=None):
         print(error_message)
         return None, error_message
 
-def allocate_credit_to_user(user, token):
+def allocate_credit_to_user(user, token, session, log_file):
     """Allocate credit to a user using the admin token by their email"""
     print(f"\n--- Allocating credits to {user['username']} (email: {user['email']}) ---")
 
@@ -258,7 +361,7 @@ def allocate_credit_to_user(user, token):
     )  # Default 100 if role not found
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{ACCOUNT_BASE_URL}/api/credits/allocate-by-email",  # Updated endpoint
             headers={
                 "Authorization": f"Bearer {token}",
@@ -272,15 +375,18 @@ def allocate_credit_to_user(user, token):
             },
         )
 
-        if response.status_code == 201:  # Assuming 201 for successful creation/allocation
+        if response.status_code == 401:
+            print(f"❌ Unauthorized while allocating credits to {user['username']}")
+            raise AdminTokenRejected(response.url)
+        elif response.status_code == 201:  # Assuming 201 for successful creation/allocation
             data = response.json()
             print(
                 f"✅ Successfully allocated {credit_amount} credits to {user['username']} (email: {user['email']})"
             )
 
             # Log successful allocation
-            with open(LOG_PATH, "a") as log_file:
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            with LOG_LOCK:
                 log_file.write(
                     f"[{timestamp}] Allocated {credit_amount} credits to {user['role']}: "
                     f"username='{user['username']}', email='{user['email']}' via email endpoint\n"
@@ -292,6 +398,8 @@ def allocate_credit_to_user(user, token):
             )
             return False
 
+    except AdminTokenRejected:
+        raise
     except requests.RequestException as e:
         print(f"❌ Request error while allocating credits to {user['username']} (email: {user['email']}): {e}")
         return False
@@ -303,66 +411,108 @@ def allocate_credit_to_user(user, token):
 
 
 def main():
-    # Create log file header if it doesn't exist or is empty
-    if not os.path.exists(LOG_PATH) or os.path.getsize(LOG_PATH) == 0:
-        with open(LOG_PATH, "w") as log_file:
+    # One append handle for the whole run instead of reopening per log entry
+    with open(LOG_PATH, "a") as log_file:
+        # Write the log file header if it is new or empty
+        if log_file.tell() == 0:
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_file.write(f"# User Add Credit Log - Started {timestamp}\n")
             log_file.write(
                 "# Format: [timestamp] Allocated credits to user_type: username='xxx', email='xxx'\n\n"
             )
 
-    # Get admin access token
-    admin_token = get_admin_token()
-    if not admin_token:
-        sys.exit(1)
-
-    print("\n=== Starting Credit Allocation Process ===")
-
-    # Combine all users that need credit allocation
-    all_users = SUPERVISOR_USERS + REGULAR_USERS
-
-    successful_allocations = 0
-    failed_allocations = 0
-
-    # Allocate credits to each user
-    for user in all_users:
-        user_data = get_user_by_email(email=user['email'], admin_token=admin_token)
-        response = create_user_account(
-            admin_token, 
-            user_data["user_id"], # This is actually the sub
-            user_data["email"], 
-            user_data["role"], 
-            user_data["username"]
-        )
-        success = allocate_credit_to_user(user, admin_token)
-        if success:
-            successful_allocations += 1
-        else:
-            failed_allocations += 1
+        # One session for every request, so connections are reused
+        session = create_session()
+
+        # Get admin access token
+        admin_token = get_admin_token(session, log_file)
+        if not admin_token:
+            sys.exit(1)
+
+        print("\n=== Starting Credit Allocation Process ===")
+
+        # Combine all users that need credit allocation
+        all_users = SUPERVISOR_USERS + REGULAR_USERS
+
+        successful_allocations = 0
+        failed_allocations = 0
+
+        # The token in use; replaced at most once if the server rejects it
+        current_token = {"token": admin_token, "refreshed": False}
+        token_lock = threading.Lock()
+
+        def refresh_admin_token(rejected_token):
+            """Drop a rejected (e.g. stale cached) token and log in again once"""
+            with token_lock:
+                if current_token["token"] == rejected_token:
+                    if current_token["refreshed"]:
+                        return None
+                    print("⚠️ Admin access token was rejected (401); logging in again")
+                    discard_cached_admin_token()
+                    current_token["token"] = get_admin_token(session, log_file)
+                    current_token["refreshed"] = True
+                return current_token["token"]
+
+        def register_and_allocate(user, token):
+            """Register the user with the accounting service and allocate credits"""
+            user_data = get_user_by_email(
+                email=user['email'], admin_token=token, session=session
+            )
+            status, _ = create_user_account(
+                session,
+                token,
+                user_data["user_id"], # This is actually the sub
+                user_data["email"], 
+                user_data["role"], 
+                user_data["username"]
+            )
+            if status == 401:
+                raise AdminTokenRejected(f"{ACCOUNT_BASE_URL}/api/admin/users")
+            return allocate_credit_to_user(user, token, session, log_file)
 
-        # Small delay between requests to avoid overwhelming the server
-        time.sleep(0.5)
+        def process_user(user):
+            """Process one user, retrying once with a fresh token after a 401"""
+            token = current_token["token"]
+            try:
+                return register_and_allocate(user, token)
+            except AdminTokenRejected:
+                token = refresh_admin_token(token)
+                if not token:
+                    return False
+            try:
+                return register_and_allocate(user, token)
+            except AdminTokenRejected:
+                print(f"❌ Admin access token rejected again for {user['username']}")
+                return False
+
+        # Allocate credits to all users concurrently
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(process_user, all_users))
+
+        for success in results:
+            if success:
+                successful_allocations += 1
+            else:
+                failed_allocations += 1
 
-    # Summary
-    print(f"\n=== Credit Allocation Summary ===")
-    print(f"✅ Successful allocations: {successful_allocations}")
-    print(f"❌ Failed allocations: {failed_allocations}")
-    print(f"📄 Log file: {LOG_PATH}")
+        # Summary
+        print(f"\n=== Credit Allocation Summary ===")
+        print(f"✅ Successful allocations: {successful_allocations}")
+        print(f"❌ Failed allocations: {failed_allocations}")
+        print(f"📄 Log file: {LOG_PATH}")
 
-    # Final log entry
-    with open(LOG_PATH, "a") as log_file:
+        # Final log entry
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_file.write(
             f"\n[{timestamp}] Credit allocation completed - "
             f"Success: {successful_allocations}, Failed: {failed_allocations}\n"
         )
 
-    if failed_allocations > 0:
-        print("\n⚠️  Some credit allocations failed. Check the log file for details.")
-        sys.exit(1)
-    else:
-        print("\n🎉 All credit allocations completed successfully!")
+        if failed_allocations > 0:
+            print("\n⚠️  Some credit allocations failed. Check the log file for details.")
+            sys.exit(1)
+        else:
+            print("\n🎉 All credit allocations completed successfully!")
 
 
 if __name__ == "__main__":
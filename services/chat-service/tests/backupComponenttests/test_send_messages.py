@@ -1,16 +1,58 @@
 #!/usr/bin/env python3
 import requests
 import json
+import os
 import sys
 import time
 import traceback
 import uuid
-import sseclient
-from colorama import Fore, Style, init
+from collections import namedtuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
-# Initialize colorama for colored terminal output
-init(autoreset=True)
+# orjson parses the per-token SSE chunks and the logged response bodies
+# faster; it is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def format_json(data):
+        """Pretty-print data for the logs"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+else:
+    json_loads = json.loads
+
+    def format_json(data):
+        """Pretty-print data for the logs"""
+        return json.dumps(data, indent=2)
+
+def response_json(response):
+    """Parse a response body; raises a ValueError subclass if it is not JSON"""
+    return json_loads(response.content)
+
+# Colored output only on a terminal and when NO_COLOR is not set; piped or
+# CI output is plain text and colorama is never imported
+USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+if USE_COLOR:
+    from colorama import Fore, Style, init
+
+    # Initialize colorama for colored terminal output
+    init(autoreset=True)
+else:
+    class Fore:
+        GREEN = CYAN = YELLOW = RED = MAGENTA = ""
+
+    class Style:
+        RESET_ALL = ""
 
 # Configuration
 AUTH_SERVICE_URL = "http://localhost:3000/api"
@@ -57,34 +99,146 @@ REGULAR_USERS = [
 # Use the first regular user for testing
 TEST_USER = REGULAR_USERS[0]
 
+# Request bodies that are the same on every call, encoded once. The message
+# templates only need the JSON-encoded model ID filled in.
+JSON_HEADERS = {"Content-Type": "application/json"}
+CREDIT_CHECK_BODY = json.dumps({
+    "userId": TEST_USER["username"],
+    "requiredCredits": 5
+}).encode("utf-8")
+NON_STREAMING_BODY = '{"message": "What are the three primary colors?", "modelId": %s}'
+STREAMING_BODY = '{"message": "Tell me about artificial intelligence", "modelId": %s}'
+
+def message_body(template, model_id):
+    """Fill a message body template with the JSON-encoded model ID"""
+    return (template % json.dumps(model_id)).encode("utf-8")
+
 class Logger:
+    # Per-thread list that collects output instead of printing it; see capture
+    _local = threading.local()
+
+    @staticmethod
+    def _print(line):
+        captured = getattr(Logger._local, "lines", None)
+        if captured is None:
+            print(line)
+        else:
+            captured.append(line)
+
+    @staticmethod
+    @contextmanager
+    def capture():
+        """Collect this thread's log lines in a list instead of printing them"""
+        Logger._local.lines = lines = []
+        try:
+            yield lines
+        finally:
+            Logger._local.lines = None
+
     @staticmethod
     def success(message):
-        print(f"{Fore.GREEN}[SUCCESS] {message}{Style.RESET_ALL}")
+        Logger._print(f"{Fore.GREEN}[SUCCESS] {message}{Style.RESET_ALL}")
 
     @staticmethod
     def info(message):
-        print(f"{Fore.CYAN}[INFO] {message}{Style.RESET_ALL}")
+        Logger._print(f"{Fore.CYAN}[INFO] {message}{Style.RESET_ALL}")
 
     @staticmethod
     def warning(message):
-        print(f"{Fore.YELLOW}[WARNING] {message}{Style.RESET_ALL}")
+        Logger._print(f"{Fore.YELLOW}[WARNING] {message}{Style.RESET_ALL}")
 
     @staticmethod
     def error(message):
-        print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
+        Logger._print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
 
     @staticmethod
     def header(message):
-        print(f"\n{Fore.MAGENTA}{'=' * 80}")
-        print(f"{Fore.MAGENTA}{message}")
-        print(f"{Fore.MAGENTA}{'=' * 80}{Style.RESET_ALL}")
+        Logger._print(f"\n{Fore.MAGENTA}{'=' * 80}")
+        Logger._print(f"{Fore.MAGENTA}{message}")
+        Logger._print(f"{Fore.MAGENTA}{'=' * 80}{Style.RESET_ALL}")
+
+SSEEvent = namedtuple("SSEEvent", "event data id retry")
+
+def iter_sse_lines(response, chunk_size=8192):
+    """
+    Yield the decoded lines of a streaming response, without line endings.
+
+    Splits on LF only and strips a trailing CR afterwards, so a CRLF that is
+    split across two reads still ends exactly one line (iter_lines would
+    report an extra blank line there).
+    """
+    pending = b""
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for raw_line in lines:
+            yield raw_line.rstrip(b"\r").decode("utf-8")
+    if pending:
+        yield pending.rstrip(b"\r").decode("utf-8")
+
+def iter_sse_events(response, chunk_size=8192):
+    """
+    Parse a streaming text/event-stream response into SSEEvent tuples.
+
+    Reads the body in chunk_size blocks rather than byte by byte. Follows
+    the same rules as sseclient: events without data are skipped, multi-line
+    data is joined with newlines, and the event name defaults to "message".
+    """
+    event, data, event_id, retry = "", [], None, None
+    for line in iter_sse_lines(response, chunk_size):
+        if not line:
+            # Blank line ends the event
+            if data:
+                yield SSEEvent(event or "message", "\n".join(data), event_id, retry)
+            event, data, event_id, retry = "", [], None, None
+            continue
+        if line.startswith(":"):
+            continue  # Comment line
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            data.append(value)
+        elif field == "event":
+            event = value
+        elif field == "id":
+            event_id = value
+        elif field == "retry":
+            retry = value
+    if data:
+        yield SSEEvent(event or "message", "\n".join(data), event_id, retry)
+
+def create_session():
+    """Create a requests Session with a pooled, retrying HTTPAdapter"""
+    session = requests.Session()
+    # Keep-alive pool for the auth/accounting/chat hosts; connection errors
+    # (and 502/503/504 on idempotent methods) are retried by urllib3.
+    # POSTs are never re-sent after reaching the server.
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class MessagingTester:
+    # Static per test process, so shared by every tester instance;
+    # run with --no-cache to always re-fetch them
+    use_cache = True
+    # Extra diagnostic requests around each message; enabled by --verbose
+    verbose = False
+    _models_cache = None
+    _api_version_cache = None
+
     def __init__(self):
-        self.session = requests.Session()
+        # Test user requests; carries the user's auth headers once authenticated
+        self.session = create_session()
+        # Admin requests; carries the admin token once authenticated
+        self.admin_session = create_session()
         self.user_token = None
         self.admin_token = None
+        # Credits successfully allocated to the test user by this tester
+        self.allocated_credits = 0
         self.headers = {}
         self.session_id = None
         self.streaming_session_id = None
@@ -100,11 +254,26 @@ class MessagingTester:
         ]
         
         all_healthy = True
-        
-        for service in services:
+
+        def probe(service):
             try:
-                Logger.info(f"Checking {service['name']} at {service['url']}...")
-                response = self.session.get(service["url"], timeout=5)
+                return service, health_session.get(service["url"], timeout=5), None
+            except requests.RequestException as e:
+                return service, None, e
+
+        for service in services:
+            Logger.info(f"Checking {service['name']} at {service['url']}...")
+
+        # Probe all services at once so one slow service doesn't delay the rest.
+        # The probes get their own session: they may run while authenticate()
+        # is updating the headers of self.session
+        with create_session() as health_session, \
+                ThreadPoolExecutor(max_workers=len(services)) as executor:
+            for service, response, error in executor.map(probe, services):
+                if error is not None:
+                    Logger.error(f"{service['name']} health check failed: {str(error)}")
+                    all_healthy = False
+                    continue
                 Logger.info(f"Response status: {response.status_code}")
                 if response.status_code == 200:
                     try:
@@ -116,9 +285,6 @@ class MessagingTester:
                     Logger.error(f"{service['name']} returned status code {response.status_code}")
                     Logger.error(f"Response: {response.text}")
                     all_healthy = False
-            except requests.RequestException as e:
-                Logger.error(f"{service['name']} health check failed: {str(e)}")
-                all_healthy = False
         
         if not all_healthy:
             Logger.error("One or more services are not healthy. This may cause test failures.")
@@ -145,6 +311,8 @@ class MessagingTester:
                     "Authorization": f"Bearer {self.user_token}",
                     "X-User-ID": TEST_USER["username"]
                 }
+                # Sent with every later request on the user session
+                self.session.headers.update(self.headers)
                 Logger.success(f"Authentication successful for {TEST_USER['username']}")
                 return True
             else:
@@ -160,7 +328,7 @@ class MessagingTester:
         Logger.header("AUTHENTICATING AS ADMIN")
         
         try:
-            response = self.session.post(
+            response = self.admin_session.post(
                 f"{AUTH_SERVICE_URL}/auth/login",
                 json={
                     "username": ADMIN_USER["username"],
@@ -171,6 +339,7 @@ class MessagingTester:
             if response.status_code == 200:
                 data = response.json()
                 self.admin_token = data.get("accessToken")
+                self.admin_session.headers["Authorization"] = f"Bearer {self.admin_token}"
                 Logger.success(f"Admin authentication successful")
                 return True
             else:
@@ -190,10 +359,8 @@ class MessagingTester:
             return False
             
         try:
-            admin_headers = {"Authorization": f"Bearer {self.admin_token}"}
-            response = self.session.post(
+            response = self.admin_session.post(
                 f"{ACCOUNTING_SERVICE_URL}/credits/allocate",
-                headers=admin_headers,
                 json={
                     "userId": TEST_USER["username"],
                     "credits": amount,
@@ -204,6 +371,7 @@ class MessagingTester:
             
             if response.status_code == 201:
                 data = response.json()
+                self.allocated_credits += amount
                 Logger.success(f"Successfully allocated {amount} credits to {TEST_USER['username']}")
                 return True
             else:
@@ -226,7 +394,6 @@ class MessagingTester:
         try:
             response = self.session.post(
                 f"{CHAT_SERVICE_URL}/chat/sessions",
-                headers=self.headers,
                 json={
                     "title": f"Test Chat Session {int(time.time())}",
                     "initialMessage": "Hello, this is a test message"
@@ -234,119 +401,147 @@ class MessagingTester:
             )
             
             if response.status_code == 201:
-                data = response.json()
+                data = response_json(response)
                 self.session_id = data.get("sessionId")
                 Logger.success(f"Chat session created successfully! Session ID: {self.session_id}")
-                Logger.info(json.dumps(data, indent=2))
+                Logger.info(format_json(data))
                 return True
             else:
                 Logger.error(f"Failed to create chat session: {response.status_code}, {response.text}")
                 return False
                 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             Logger.error(f"Chat session creation error: {str(e)}")
             return False
     
+    def open_worker_chat_session(self, session):
+        """Create a chat session for one worker thread; returns its ID or None"""
+        try:
+            response = session.post(
+                f"{CHAT_SERVICE_URL}/chat/sessions",
+                json={
+                    "title": f"Test Chat Session {int(time.time())}",
+                    "initialMessage": "Hello, this is a test message"
+                }
+            )
+            if response.status_code == 201:
+                return response_json(response).get("sessionId")
+            Logger.error(f"Failed to create chat session: {response.status_code}, {response.text}")
+        except (requests.RequestException, ValueError) as e:
+            Logger.error(f"Chat session creation error: {str(e)}")
+        return None
+
+    def close_worker_chat_session(self, session, chat_session_id):
+        """Delete a chat session created by open_worker_chat_session"""
+        try:
+            response = session.delete(f"{CHAT_SERVICE_URL}/chat/sessions/{chat_session_id}")
+            if response.status_code != 200:
+                Logger.warning(f"Failed to delete chat session {chat_session_id}: {response.status_code}")
+        except requests.RequestException as e:
+            Logger.warning(f"Chat session deletion error: {str(e)}")
+
     def get_available_models(self):
         """Get available AI models"""
         Logger.header("GETTING AVAILABLE MODELS")
+
+        if self.use_cache and MessagingTester._models_cache:
+            Logger.info(f"Using cached model: {MessagingTester._models_cache}")
+            return MessagingTester._models_cache
         
         try:
-            response = self.session.get(
-                f"{CHAT_SERVICE_URL}/models",
-                headers=self.headers
-            )
+            response = self.session.get(f"{CHAT_SERVICE_URL}/models")
             
             if response.status_code == 200:
-                data = response.json()
+                data = response_json(response)
                 models = data.get("models", [])
                 Logger.success(f"Retrieved {len(models)} available models")
-                Logger.info(json.dumps(data, indent=2))
+                Logger.info(format_json(data))
                 
                 # Return the first available model for tests
                 available_models = [m for m in models if m.get("available", False)]
                 if available_models:
-                    return available_models[0]["id"]
+                    MessagingTester._models_cache = available_models[0]["id"]
+                    return MessagingTester._models_cache
                 else:
                     return None
             else:
                 Logger.error(f"Failed to get available models: {response.status_code}, {response.text}")
                 return None
                 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             Logger.error(f"Model retrieval error: {str(e)}")
             return None
 
-    def send_non_streaming_message(self, model_id):
-        """Send a regular (non-streaming) message with enhanced debugging"""
+    def send_non_streaming_message(self, model_id, session=None, chat_session_id=None):
+        """
+        Send a regular (non-streaming) message with enhanced debugging
+
+        Worker threads pass their own authenticated session and chat session ID.
+        """
         Logger.header(f"SENDING NON-STREAMING MESSAGE USING {model_id}")
+        session = session or self.session
+        chat_session_id = chat_session_id or self.session_id
         
-        if not self.session_id:
+        if not chat_session_id:
             Logger.error("No active session ID. Create a session first.")
             return False
         
         # Enhanced logging for request details
-        Logger.info(f"Session ID: {self.session_id}")
+        Logger.info(f"Session ID: {chat_session_id}")
         Logger.info(f"Model ID: {model_id}")
         Logger.info(f"Headers: {json.dumps(self.headers)}")
         
-        # Additional debugging: check user balance before sending message
-        try:
-            Logger.info("Checking credit balance before sending message...")
-            balance_response = requests.get(
-                f"{ACCOUNTING_SERVICE_URL}/credits/balance",
-                headers=self.headers
-            )
+        # Diagnostic balance and credit checks cost two extra round trips per
+        # message, so they only run with --verbose
+        if self.verbose:
+            # Additional debugging: check user balance before sending message
+            try:
+                Logger.info("Checking credit balance before sending message...")
+                balance_response = session.get(f"{ACCOUNTING_SERVICE_URL}/credits/balance")
             
-            if balance_response.status_code == 200:
-                balance_data = balance_response.json()
-                Logger.info(f"Current credit balance: {json.dumps(balance_data)}")
+                if balance_response.status_code == 200:
+                    balance_data = balance_response.json()
+                    Logger.info(f"Current credit balance: {json.dumps(balance_data)}")
                 
-                # Warn if balance is low
-                if balance_data.get('totalCredits', 0) < 100:
-                    Logger.warning(f"Credit balance is low: {balance_data.get('totalCredits')} credits")
-            else:
-                Logger.warning(f"Failed to get credit balance: {balance_response.status_code}")
-                Logger.info(balance_response.text)
-        except Exception as e:
-            Logger.warning(f"Error checking credit balance: {str(e)}")
+                    # Warn if balance is low
+                    if balance_data.get('totalCredits', 0) < 100:
+                        Logger.warning(f"Credit balance is low: {balance_data.get('totalCredits')} credits")
+                else:
+                    Logger.warning(f"Failed to get credit balance: {balance_response.status_code}")
+                    Logger.info(balance_response.text)
+            except Exception as e:
+                Logger.warning(f"Error checking credit balance: {str(e)}")
         
-        # Try manually checking credits first
-        try:
-            Logger.info("Manually checking credit availability...")
-            # DEBUG.MD_NOTE: Credit Service Integration Issues
-            # The debug.md mentions: "Error checking user credits: Request failed with status code 400
-            # Message: Missing or invalid required fields" due to sending an empty JSON object `{}`
-            # to the accounting service\'s /credits/check endpoint.
-            # This specific manual check in the test script *does* send a payload with "userId"
-            # and "requiredCredits", which seems correct.
-            # The error in debug.md likely refers to an *internal* call made by the chat-service
-            # to the accounting-service, which should be investigated in the chat-service codebase.
-            # Ensure that all calls to /credits/check include necessary fields like userId, modelId, etc.
-            credit_check_response = requests.post(
-                f"{ACCOUNTING_SERVICE_URL}/credits/check",
-                headers=self.headers,
-                json={
-                    "userId": TEST_USER["username"], # Corrected payload
-                    "requiredCredits": 5 
-                }
-            )
+            # Try manually checking credits first
+            try:
+                Logger.info("Manually checking credit availability...")
+                # DEBUG.MD_NOTE: Credit Service Integration Issues
+                # The debug.md mentions: "Error checking user credits: Request failed with status code 400
+                # Message: Missing or invalid required fields" due to sending an empty JSON object `{}`
+                # to the accounting service\'s /credits/check endpoint.
+                # This specific manual check in the test script *does* send a payload with "userId"
+                # and "requiredCredits", which seems correct.
+                # The error in debug.md likely refers to an *internal* call made by the chat-service
+                # to the accounting-service, which should be investigated in the chat-service codebase.
+                # Ensure that all calls to /credits/check include necessary fields like userId, modelId, etc.
+                credit_check_response = session.post(
+                    f"{ACCOUNTING_SERVICE_URL}/credits/check",
+                    data=CREDIT_CHECK_BODY,
+                    headers=JSON_HEADERS
+                )
             
-            Logger.info(f"Credit check response status: {credit_check_response.status_code}")
-            Logger.info(f"Credit check response: {credit_check_response.text}")
-        except Exception as e:
-            Logger.warning(f"Error in manual credit check: {str(e)}")
+                Logger.info(f"Credit check response status: {credit_check_response.status_code}")
+                Logger.info(f"Credit check response: {credit_check_response.text}")
+            except Exception as e:
+                Logger.warning(f"Error in manual credit check: {str(e)}")
         
         try:
             Logger.info(f"Sending non-streaming message with model {model_id}...")
             req_start_time = time.time()
-            response = self.session.post(
-                f"{CHAT_SERVICE_URL}/chat/sessions/{self.session_id}/messages",
-                headers=self.headers,
-                json={
-                    "message": "What are the three primary colors?",
-                    "modelId": model_id
-                },
+            response = session.post(
+                f"{CHAT_SERVICE_URL}/chat/sessions/{chat_session_id}/messages",
+                data=message_body(NON_STREAMING_BODY, model_id),
+                headers=JSON_HEADERS,
                 timeout=60
             )
             req_duration = time.time() - req_start_time
@@ -356,18 +551,19 @@ class MessagingTester:
             Logger.info(f"Response status: {response.status_code}")
             Logger.info(f"Response headers: {dict(response.headers)}")
             
-            # Log truncated response body (first 500 chars)
-            response_text = response.text
-            Logger.info(f"Response body (truncated): {response_text[:500]}")
-            if len(response_text) > 500:
+            # Log truncated response body (first 500 bytes); only that slice
+            # is decoded here
+            raw_body = response.content
+            Logger.info(f"Response body (truncated): {raw_body[:500].decode('utf-8', 'replace')}")
+            if len(raw_body) > 500:
                 Logger.info("Response too long to display in full")
             
             # Enhanced error handling based on status code
             if response.status_code == 200:
                 Logger.success(f"Non-streaming message with {model_id} sent successfully!")
                 try:
-                    data = response.json()
-                    Logger.info(json.dumps(data, indent=2))
+                    data = response_json(response)
+                    Logger.info(format_json(data))
                     return True
                 except json.JSONDecodeError:
                     Logger.warning("Response not in JSON format")
@@ -408,16 +604,27 @@ class MessagingTester:
             'amazon.nova-lite-v1:0'   # Corrected model ID
         ]
         
-        results = {}
-        
-        for model_id in models_to_test:
-            Logger.header(f"TESTING MODEL: {model_id}")
-            result = self.send_non_streaming_message(model_id)
-            results[model_id] = result
-            
-            # Add a small delay between requests to avoid rate limiting
-            time.sleep(3)
-        
+        def test_model(model_id, own_chat_session):
+            # Output is held back and printed per model once the worker is done
+            with Logger.capture() as lines:
+                Logger.header(f"TESTING MODEL: {model_id}")
+                return self.send_model_message(model_id, own_chat_session), lines
+
+        # Each model call is an independent round trip, so run them in
+        # parallel. The first model uses the tester's chat session; the others
+        # get their own so no two requests share a conversation.
+        with ThreadPoolExecutor(max_workers=len(models_to_test)) as executor:
+            futures = {
+                model_id: executor.submit(test_model, model_id, index > 0)
+                for index, model_id in enumerate(models_to_test)
+            }
+            # Collected in submission order so logs and summary follow the
+            # order the models are given in
+            results = {}
+            for model_id, future in futures.items():
+                results[model_id], lines = future.result()
+                print("\n".join(lines))
+
         # Print summary
         Logger.header("NOVA MODELS TEST SUMMARY")
         all_passed = True
@@ -431,6 +638,28 @@ class MessagingTester:
         
         return all_passed
     
+    def send_model_message(self, model_id, own_chat_session):
+        """
+        send_non_streaming_message from a worker thread, on a requests session
+        of its own; with own_chat_session it also uses a chat session of its
+        own, created before and deleted after the message.
+        """
+        # requests sessions are not shared between threads
+        with create_session() as session:
+            session.headers.update(self.headers)
+            if not own_chat_session:
+                return self.send_non_streaming_message(model_id, session=session)
+
+            chat_session_id = self.open_worker_chat_session(session)
+            if not chat_session_id:
+                return False
+            try:
+                return self.send_non_streaming_message(
+                    model_id, session=session, chat_session_id=chat_session_id
+                )
+            finally:
+                self.close_worker_chat_session(session, chat_session_id)
+
     def send_streaming_message(self, model_id):
         """Send a streaming message with improved handling for race conditions"""
         Logger.header("SENDING STREAMING MESSAGE TO: " + str(model_id))
@@ -440,38 +669,30 @@ class MessagingTester:
             return False
             
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{CHAT_SERVICE_URL}/chat/sessions/{self.session_id}/stream",
-                headers=self.headers,
-                json={
-                    "message": "Tell me about artificial intelligence",
-                    "modelId": model_id
-                },
+                data=message_body(STREAMING_BODY, model_id),
+                headers=JSON_HEADERS,
                 stream=True
             )
             
             if response.status_code == 200:
                 Logger.success("Streaming response started! Showing chunks...")
                 
-                # Extract streaming session ID with thorough header checking
-                self.streaming_session_id = None
-                for header, value in response.headers.items():
-                    if header.lower() == 'x-streaming-session-id'.lower():
-                        self.streaming_session_id = value
-                        Logger.info(f"Streaming session ID: {self.streaming_session_id}")
-                        break
-                        
-                if not self.streaming_session_id:
+                # Extract streaming session ID (response headers are case-insensitive)
+                self.streaming_session_id = response.headers.get("X-Streaming-Session-Id")
+                if self.streaming_session_id:
+                    Logger.info(f"Streaming session ID: {self.streaming_session_id}")
+                else:
                     # If not in headers, generate a temporary one
                     self.streaming_session_id = f"stream-{int(time.time())}-{str(id(self))[-8:]}"
                     Logger.info(f"Generated temporary streaming ID: {self.streaming_session_id}")
                 
-                client = sseclient.SSEClient(response)
                 full_response = ""
                 chunks_received = 0
                 tokens_used = 100  # Default value
                 
-                for event in client.events():
+                for event in iter_sse_events(response):
                     Logger.info(f"Received SSE event: event=\'{event.event}\', data=\'{event.data}\', id=\'{event.id}\', retry=\'{event.retry}\'") # Log all SSE events
                     if event.event == "chunk":
                         try:
@@ -481,7 +702,7 @@ class MessagingTester:
                             # This suggests that the JSON strings being sent in the SSE stream from the server 
                             # might contain unescaped characters or be malformed.
                             # This points to a server-side issue in the chat-service when generating SSE chunks.
-                            data = json.loads(event.data)
+                            data = json_loads(event.data)
                             text = data.get('text', '')
                             full_response += text
                             chunks_received += 1
@@ -492,7 +713,7 @@ class MessagingTester:
                             Logger.warning(f"Failed to parse chunk: {str(e)}")
                     elif event.event == "done":
                         try:
-                            data = json.loads(event.data)
+                            data = json_loads(event.data)
                             tokens_used = data.get('tokensUsed', 100)
                             Logger.info(f"Stream complete. Tokens used: {tokens_used}")
                         except Exception as e:
@@ -502,14 +723,15 @@ class MessagingTester:
                     if chunks_received >= 10:
                         Logger.info("Received enough chunks, finishing test...")
                         break
+
+                # Release the connection now rather than leaving the stream open
+                response.close()
                 
                 Logger.success(f"Received {chunks_received} chunks. Total response length: {len(full_response)}")
                 
-                # Add delay to prevent race conditions - allow server to process streaming session
-                Logger.info("Adding delay to allow server processing...")
-                time.sleep(2)
-                
-                # Update the stream response with retry mechanism
+                # Update the stream response with retry mechanism; a session ID
+                # mismatch from a server still finishing the stream is retried
+                # with backoff below, so no up-front delay is needed
                 max_retries = 3
                 for attempt in range(max_retries):
                     Logger.info(f"Updating chat with stream response (Attempt {attempt+1}/{max_retries})...")
@@ -517,7 +739,6 @@ class MessagingTester:
                     try:
                         update_response = self.session.post(
                             f"{CHAT_SERVICE_URL}/chat/sessions/{self.session_id}/update-stream",
-                            headers=self.headers,
                             json={
                                 "completeResponse": full_response or "AI response placeholder",
                                 "streamingSessionId": self.streaming_session_id,
@@ -527,7 +748,7 @@ class MessagingTester:
                         
                         if update_response.status_code == 200:
                             Logger.success("Stream response updated successfully!")
-                            Logger.info(json.dumps(update_response.json(), indent=2))
+                            Logger.info(format_json(response_json(update_response)))
                             return True
                         elif update_response.status_code == 400 and "mismatch" in update_response.text.lower():
                             # This indicates a streaming session ID mismatch - might be a race condition
@@ -563,8 +784,7 @@ class MessagingTester:
                 
         except Exception as e:
             Logger.error(f"Streaming error: {str(e)}")
-            import traceback
-            Logger.warning(traceback.format_exc())
+            Logger.error(traceback.format_exc())
             return False
     
     def delete_chat_session(self):
@@ -576,28 +796,29 @@ class MessagingTester:
             return False
             
         try:
-            response = self.session.delete(
-                f"{CHAT_SERVICE_URL}/chat/sessions/{self.session_id}",
-                headers=self.headers
-            )
+            response = self.session.delete(f"{CHAT_SERVICE_URL}/chat/sessions/{self.session_id}")
             
             if response.status_code == 200:
-                data = response.json()
+                data = response_json(response)
                 Logger.success(f"Chat session deleted successfully!")
-                Logger.info(json.dumps(data, indent=2))
+                Logger.info(format_json(data))
                 self.session_id = None
                 return True
             else:
                 Logger.error(f"Failed to delete chat session: {response.status_code}, {response.text}")
                 return False
                 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             Logger.error(f"Chat session deletion error: {str(e)}")
             return False
     
     def get_api_version(self):
         """Get the API version from the /api/version endpoint"""
         Logger.header("GETTING API VERSION")
+
+        if self.use_cache and MessagingTester._api_version_cache:
+            Logger.info(f"API Version (cached): {MessagingTester._api_version_cache}")
+            return MessagingTester._api_version_cache
         
         try:
             response = self.session.get(f"{CHAT_SERVICE_URL}/version")
@@ -605,6 +826,7 @@ class MessagingTester:
             if response.status_code == 200:
                 Logger.success(f"API version retrieved successfully")
                 Logger.info(f"API Version: {response.text}")
+                MessagingTester._api_version_cache = response.text
                 return response.text
             else:
                 Logger.error(f"Failed to get API version: {response.status_code}, {response.text}")
@@ -614,27 +836,60 @@ class MessagingTester:
             Logger.error(f"API version retrieval error: {str(e)}")
             return None
 
-def run_test():
-    Logger.header("CHAT MESSAGE SENDING TEST SCRIPT")
-    
+# Tester shared by run_test and test_nova_models_only within one process
+_shared_tester = None
+_shared_tester_lock = threading.Lock()
+
+def _create_shared_tester():
+    """Check service health and log in the test user and admin"""
     tester = MessagingTester()
-    results = []
-    
+
+    # The health check and the two logins are independent round trips,
+    # so run them together; results are still checked in order
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        healthy = executor.submit(tester.check_services_health)
+        user_auth = executor.submit(tester.authenticate)
+        admin_auth = executor.submit(tester.authenticate_admin)
+
     # Check services health
-    if not tester.check_services_health():
+    if not healthy.result():
         Logger.error("Services check failed. Cannot continue with tests.")
         sys.exit(1)
-    
+
     # Authenticate users
-    if not tester.authenticate():
+    if not user_auth.result():
         Logger.error("Test user authentication failed. Cannot continue with tests.")
         sys.exit(1)
-        
-    if not tester.authenticate_admin():
+
+    if not admin_auth.result():
         Logger.warning("Admin authentication failed. Some tests may fail.")
+
+    return tester
+
+def get_shared_tester(credits=20000):
+    """
+    Return a tester that has checked service health, authenticated the test
+    user and admin, and allocated at least `credits` credits. The setup runs
+    once per process; later callers reuse the same authenticated tester, and
+    a caller asking for more credits than were allocated so far gets the
+    difference topped up.
+    """
+    global _shared_tester
+    with _shared_tester_lock:
+        if _shared_tester is None:
+            _shared_tester = _create_shared_tester()
+        tester = _shared_tester
+
+        if tester.allocated_credits < credits:
+            # Allocate more credits specifically for non-streaming tests
+            tester.allocate_non_streaming_credits(credits - tester.allocated_credits)
+        return tester
+
+def run_test():
+    Logger.header("CHAT MESSAGE SENDING TEST SCRIPT")
     
-    # Allocate more credits specifically for non-streaming tests
-    tester.allocate_non_streaming_credits()
+    tester = get_shared_tester()
+    results = []
     
     # Create a new chat session
     if not tester.create_chat_session():
@@ -694,23 +949,7 @@ def test_nova_models_only():
     """Run only the Nova models test"""
     Logger.header("NOVA MODELS TEST SCRIPT")
     
-    tester = MessagingTester()
-    
-    # Check services health
-    if not tester.check_services_health():
-        Logger.error("Services check failed. Cannot continue with tests.")
-        sys.exit(1)
-    
-    # Authenticate
-    if not tester.authenticate():
-        Logger.error("Test user authentication failed. Cannot continue with tests.")
-        sys.exit(1)
-        
-    if not tester.authenticate_admin():
-        Logger.warning("Admin authentication failed. Some tests may fail.")
-    
-    # Allocate credits
-    tester.allocate_non_streaming_credits(30000)
+    tester = get_shared_tester(credits=30000)
     
     # Create session
     if not tester.create_chat_session():
@@ -740,42 +979,50 @@ def test_nova_models_only():
 # Unit test class for sending messages
 class TestSendMessages(unittest.TestCase):
 
-    def test_create_session_and_send_initial_message(self):
-        """
-        Tests creating a new chat session and sending an initial message.
-        This test includes placeholder authentication headers. For the userId validation
-        error to be resolved, the chat-service must be able to validate the
-        auth_token and derive a userId from it.
-        """
+    @classmethod
+    def setUpClass(cls):
+        """Create one pooled session for every request made by these tests"""
         # Placeholder for obtaining a valid token and user ID.
         # In a real test environment, this token would be dynamically generated
         # or retrieved from a secure configuration.
         auth_token = "FAKE_TOKEN_PLACEHOLDER"
-        
+
         # The session.controller.ts uses req.headers['x-user-id'] for 'username',
         # while 'userId' is expected to come from req.user.userId (populated by auth middleware from the token).
-        user_id_header_for_username = "test_user_from_python" 
+        user_id_header_for_username = "test_user_from_python"
 
-        headers = {
+        # Content-Type is set per request by json=
+        cls.headers = {
             "Authorization": f"Bearer {auth_token}",
-            "X-User-ID": user_id_header_for_username, 
-            "Content-Type": "application/json"
+            "X-User-ID": user_id_header_for_username
         }
+        cls.session = create_session()
+        cls.session.headers.update(cls.headers)
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+
+    def test_create_session_and_send_initial_message(self):
+        """
+        Tests creating a new chat session and sending an initial message.
+        This test includes placeholder authentication headers. For the userId validation
+        error to be resolved, the chat-service must be able to validate the
+        auth_token and derive a userId from it.
+        """
         session_payload = {
             "title": "Test Session from Python Script",
             "initialMessage": "Hello, this is an initial message from test_send_messages.py!"
             # "modelId": "your_default_model_id_here" # Optional: specify a modelId if needed
         }
 
-        print(f"Attempting to create chat session at {CHAT_SERVICE_BASE_URL}/sessions with payload: {json.dumps(session_payload)} and headers: {headers}")
+        print(f"Attempting to create chat session at {CHAT_SERVICE_URL}/chat/sessions with payload: {json.dumps(session_payload)} and headers: {self.headers}")
 
         try:
             # Endpoint for creating a chat session is typically /sessions
-            response = requests.post(
-                f"{CHAT_SERVICE_BASE_URL}/sessions", # Assuming this is the endpoint from chat-service routes
-                headers=headers,
-                data=json.dumps(session_payload),
+            response = self.session.post(
+                f"{CHAT_SERVICE_URL}/chat/sessions", # Assuming this is the endpoint from chat-service routes
+                json=session_payload,
                 timeout=10 # Adding a timeout for the request
             )
 
@@ -798,10 +1045,9 @@ class TestSendMessages(unittest.TestCase):
             # message_payload = {
             #     "message": "This is a follow-up message."
             # }
-            # message_response = requests.post(
-            #     f"{CHAT_SERVICE_BASE_URL}/sessions/{session_id}/messages", # Assuming endpoint structure
-            #     headers=headers,
-            #     data=json.dumps(message_payload)
+            # message_response = self.session.post(
+            #     f"{CHAT_SERVICE_URL}/chat/sessions/{session_id}/messages", # Assuming endpoint structure
+            #     json=message_payload
             # )
             # self.assertEqual(message_response.status_code, 200, "Failed to send follow-up message.")
             # print(f"Successfully sent follow-up message to session {session_id}")
@@ -810,7 +1056,7 @@ class TestSendMessages(unittest.TestCase):
         except requests.exceptions.HTTPError as http_err:
             self.fail(f"HTTP error occurred during chat session creation: {http_err} - Response: {http_err.response.text if http_err.response else 'No response'}")
         except requests.exceptions.ConnectionError as conn_err:
-            self.fail(f"Connection error occurred: Could not connect to {CHAT_SERVICE_BASE_URL}/sessions. Ensure chat-service is running. Error: {conn_err}")
+            self.fail(f"Connection error occurred: Could not connect to {CHAT_SERVICE_URL}/chat/sessions. Ensure chat-service is running. Error: {conn_err}")
         except requests.exceptions.Timeout as timeout_err:
             self.fail(f"Request timed out: {timeout_err}")
         except requests.exceptions.RequestException as req_err:
@@ -821,8 +1067,16 @@ class TestSendMessages(unittest.TestCase):
             self.fail(f"An unexpected error occurred in the test: {e}")
 
 if __name__ == "__main__":
+    # --no-cache re-fetches the model list and API version for every tester
+    if "--no-cache" in sys.argv[1:]:
+        MessagingTester.use_cache = False
+
+    # --verbose adds the balance and credit checks before each message
+    if "--verbose" in sys.argv[1:]:
+        MessagingTester.verbose = True
+
     # Check if we should run only the Nova models test
-    if len(sys.argv) > 1 and sys.argv[1] == "--nova-only":
+    if "--nova-only" in sys.argv[1:]:
         success = test_nova_models_only()
     else:
         success = run_test()
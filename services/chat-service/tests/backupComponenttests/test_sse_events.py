@@ -0,0 +1,66 @@
+"""iter_sse_events must give the same events for any read size and line ending"""
+
+from test_send_messages import SSEEvent, iter_sse_events
+
+STREAM = (
+    "event: chunk\n"
+    "data: {\"content\": \"Hello\"}\n"
+    "\n"
+    ": keep-alive comment\n"
+    "event: chunk\n"
+    "id: 2\n"
+    "data: first line\n"
+    "data: second line\n"
+    "\n"
+    "data: default name\n"
+    "retry: 1000\n"
+    "\n"
+    "event: complete\n"
+    "data: {\"tokens\": 12}\n"
+    "\n"
+)
+
+EXPECTED = [
+    SSEEvent("chunk", "{\"content\": \"Hello\"}", None, None),
+    SSEEvent("chunk", "first line\nsecond line", "2", None),
+    SSEEvent("message", "default name", None, "1000"),
+    SSEEvent("complete", "{\"tokens\": 12}", None, None),
+]
+
+
+class FakeStreamResponse:
+    """Stands in for a streaming requests.Response"""
+
+    def __init__(self, body):
+        self.body = body
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def parse(text, chunk_size):
+    response = FakeStreamResponse(text.encode("utf-8"))
+    return list(iter_sse_events(response, chunk_size=chunk_size))
+
+
+def test_lf_stream_any_chunk_size():
+    """LF-terminated events parse the same for every read size"""
+    for chunk_size in range(1, len(STREAM) + 2):
+        assert parse(STREAM, chunk_size) == EXPECTED, chunk_size
+
+
+def test_crlf_stream_any_chunk_size():
+    """CRLF split across two reads never adds a blank line"""
+    stream = STREAM.replace("\n", "\r\n")
+    for chunk_size in range(1, len(stream) + 2):
+        assert parse(stream, chunk_size) == EXPECTED, chunk_size
+
+
+def test_unterminated_last_event():
+    """An event cut off without its blank line is still delivered"""
+    for chunk_size in (1, 2, 3, 8192):
+        assert parse("event: chunk\r\ndata: tail", chunk_size) == [
+            SSEEvent("chunk", "tail", None, None)
+        ]
+